@@ -22,7 +22,7 @@ from gi.repository import GObject
 class MusicFile(GObject.Object):
     """Model representing a music file with metadata"""
     
-    def __init__(self, path, title, artist, album, duration, duration_seconds=0, album_art=None):
+    def __init__(self, path, title, artist, album, duration, duration_seconds=0, has_album_art=False):
         super().__init__()
         self.path = path
         self.title = title
@@ -30,7 +30,10 @@ class MusicFile(GObject.Object):
         self.album = album
         self.duration = duration
         self.duration_seconds = duration_seconds
-        self.album_art = album_art
+        self.has_album_art = has_album_art  # Artwork is loaded lazily by AlbumArtService
+        self.subtitle = f"{artist} • {album}"  # Display line shown under the title
+        self.has_lyrics = None  # Unknown until checked
+        self.download_state = 'idle'  # Download button state shown for this file
     
     def __str__(self):
         return f"{self.artist} - {self.title}"
@@ -0,0 +1,192 @@
+# album_art_service.py
+#
+# Copyright 2025 Akbar Hamaminatu.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import base64
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from gi.repository import Gdk, Gio, GLib, GdkPixbuf
+import mutagen
+from .logger_service import get_logger
+
+class AlbumArtService:
+    """Service for loading embedded album art on demand"""
+
+    ART_SIZE = 64  # Decoded artwork size in pixels
+    CACHE_SIZE = 256  # Number of decoded textures kept in memory
+
+    _logger = None
+    _cache = OrderedDict()  # Cache key -> Gdk.Texture (or None), least recently used first
+    _lock = threading.Lock()
+    _executor = None
+
+    @classmethod
+    def _get_logger(cls):
+        """Get logger instance"""
+        if cls._logger is None:
+            cls._logger = get_logger('album_art_service')
+        return cls._logger
+
+    @classmethod
+    def _get_executor(cls):
+        """Get the worker used for decoding artwork"""
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='album-art')
+        return cls._executor
+
+    @staticmethod
+    def extract_artwork_data(audio_file):
+        """
+        Get the raw embedded artwork bytes from a parsed mutagen file.
+
+        Args:
+            audio_file: File object returned by mutagen.File
+
+        Returns:
+            Encoded image bytes, or None if the file has no artwork
+        """
+        # For MP3 files with ID3 tags
+        if hasattr(audio_file, 'tags') and audio_file.tags:
+            for key, value in audio_file.tags.items():
+                if isinstance(key, str) and key.startswith('APIC'):
+                    return value.data
+
+        # For MP4 files
+        if 'covr' in audio_file:
+            return bytes(audio_file['covr'][0])
+
+        # For FLAC files
+        if hasattr(audio_file, 'pictures') and audio_file.pictures:
+            return audio_file.pictures[0].data
+
+        # For OGG files
+        if hasattr(audio_file, 'tags') and audio_file.tags:
+            # Look for METADATA_BLOCK_PICTURE in OGG files
+            if 'METADATA_BLOCK_PICTURE' in audio_file.tags:
+                from mutagen.flac import Picture
+                pic_data = audio_file.tags['METADATA_BLOCK_PICTURE'][0]
+                return Picture(base64.b64decode(pic_data)).data
+
+        return None
+
+    @staticmethod
+    def has_artwork(audio_file):
+        """
+        Check for embedded artwork without copying or decoding the image.
+
+        Args:
+            audio_file: File object returned by mutagen.File
+
+        Returns:
+            True if the file has embedded artwork
+        """
+        tags = getattr(audio_file, 'tags', None)
+
+        # For MP3 files with ID3 tags, and OGG files
+        if tags:
+            if any(isinstance(key, str) and key.startswith('APIC') for key in tags.keys()):
+                return True
+            if 'METADATA_BLOCK_PICTURE' in tags:
+                return True
+
+        # For MP4 files
+        if 'covr' in audio_file:
+            return True
+
+        # For FLAC files
+        return bool(getattr(audio_file, 'pictures', None))
+
+    @classmethod
+    def get_cached(cls, cache_key):
+        """
+        Look up already decoded album art without touching the file.
+
+        Args:
+            cache_key: Key the texture was cached under
+
+        Returns:
+            Tuple of (found, texture); texture is None for files without artwork
+        """
+        with cls._lock:
+            if cache_key in cls._cache:
+                cls._cache.move_to_end(cache_key)
+                return True, cls._cache[cache_key]
+        return False, None
+
+    @classmethod
+    def load_album_art(cls, music_file_path: str, cache_key=None):
+        """
+        Decode the embedded album art of a music file, using the cache.
+
+        Args:
+            music_file_path: Path to the music file
+            cache_key: Key to share the texture under, e.g. per album (defaults to the path)
+
+        Returns:
+            Gdk.Texture scaled to ART_SIZE, or None if there is no artwork
+        """
+        if cache_key is None:
+            cache_key = music_file_path
+
+        with cls._lock:
+            if cache_key in cls._cache:
+                cls._cache.move_to_end(cache_key)
+                return cls._cache[cache_key]
+
+        texture = None
+        try:
+            audio_file = mutagen.File(music_file_path)
+            artwork_data = cls.extract_artwork_data(audio_file) if audio_file is not None else None
+            if artwork_data:
+                input_stream = Gio.MemoryInputStream.new_from_data(artwork_data)
+                pixbuf = GdkPixbuf.Pixbuf.new_from_stream_at_scale(
+                    input_stream, cls.ART_SIZE, cls.ART_SIZE, True, None
+                )
+                # Upload once; the immutable texture is shared by every row showing it
+                texture = Gdk.Texture.new_for_pixbuf(pixbuf)
+        except Exception as e:
+            cls._get_logger().error(f"Error loading album art for {music_file_path}: {e}")
+
+        with cls._lock:
+            cls._cache[cache_key] = texture
+            if len(cls._cache) > cls.CACHE_SIZE:
+                cls._cache.popitem(last=False)
+        return texture
+
+    @classmethod
+    def load_album_art_async(cls, music_file_path: str, callback, cache_key=None):
+        """
+        Decode album art in a worker thread.
+
+        Args:
+            music_file_path: Path to the music file
+            callback: Called on the main loop with the texture (or None)
+            cache_key: Key to share the texture under (defaults to the path)
+        """
+        def load():
+            texture = cls.load_album_art(music_file_path, cache_key)
+            GLib.idle_add(callback, texture)
+
+        cls._get_executor().submit(load)
+
+    @classmethod
+    def clear_cache(cls):
+        """Drop all decoded artwork"""
+        with cls._lock:
+            cls._cache.clear()
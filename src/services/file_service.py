@@ -249,16 +249,19 @@ class FileService:
         logger.debug(f"Writing LRC file: {lrc_path}")
         
         try:
-            # Create backup if file exists and backup is requested
-            if create_backup and os.path.exists(lrc_path):
-                backup_path = FileService.backup_existing_file(lrc_path)
-                # backup_existing_file already logs the backup creation
+            # Create backup if file exists and backup is requested;
+            # backup_existing_file checks for the file and logs the backup
+            if create_backup:
+                FileService.backup_existing_file(lrc_path)
             
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(lrc_path), exist_ok=True)
-            
-            # Write the file
-            with open(lrc_path, 'w', encoding='utf-8') as f:
+            # Write the file; the LRC sits next to its music file, so its
+            # directory only has to be created in the rare case it is missing
+            try:
+                f = open(lrc_path, 'w', encoding='utf-8')
+            except FileNotFoundError:
+                os.makedirs(os.path.dirname(lrc_path), exist_ok=True)
+                f = open(lrc_path, 'w', encoding='utf-8')
+            with f:
                 f.write(content)
             
             logger.info(f"Successfully wrote LRC file: {lrc_path}")
@@ -17,8 +17,11 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-import urllib.request
+import base64
+import http.client
+import urllib.error
 import urllib.parse
+import urllib.request
 import json
 import time
 import threading
@@ -61,8 +64,17 @@ class RateLimiter:
 class LRCLibClient:
     """Client for interacting with LRCLib API"""
     
-    BASE_URL = "https://lrclib.net/api"
+    API_HOST = "lrclib.net"
+    API_PATH = "/api"
+    BASE_URL = f"https://{API_HOST}{API_PATH}"
     USER_AGENT = "Composer/1.0 (https://github.com/Gasiyu/Composer)"
+    REQUEST_TIMEOUT = 10  # Seconds
+    MAX_IDLE_CONNECTIONS = 8  # Keep-alive connections kept for reuse
+    
+    # Searches run on short-lived threads, so idle connections are pooled
+    # per process rather than per thread to actually get reused
+    _idle_connections = []
+    _connections_lock = threading.Lock()
     
     def __init__(self):
         self.rate_limiter = RateLimiter(max_requests=10, time_window=60)
@@ -74,6 +86,93 @@ class LRCLibClient:
         self.logger = get_logger('lrclib_client')
         self.logger.info("LRCLib client initialized")
     
+    @classmethod
+    def _take_connection(cls):
+        """Get an idle keep-alive connection, or a new one; returns (connection, reused)"""
+        with cls._connections_lock:
+            if cls._idle_connections:
+                return cls._idle_connections.pop(), True
+        return cls._new_connection(), False
+    
+    @classmethod
+    def _new_connection(cls):
+        """Open a new connection to the API host, through the HTTPS proxy if one is configured"""
+        proxy = urllib.request.getproxies().get('https')
+        if not proxy or urllib.request.proxy_bypass(cls.API_HOST):
+            return http.client.HTTPSConnection(cls.API_HOST, timeout=cls.REQUEST_TIMEOUT)
+        
+        # Same environment variables urllib honors; tunnel to the API with CONNECT
+        if '://' not in proxy:
+            proxy = f"http://{proxy}"
+        proxy_url = urllib.parse.urlsplit(proxy)
+        tunnel_headers = {}
+        if proxy_url.username:
+            credentials = f"{urllib.parse.unquote(proxy_url.username)}:{urllib.parse.unquote(proxy_url.password or '')}"
+            tunnel_headers['Proxy-Authorization'] = 'Basic ' + base64.b64encode(credentials.encode()).decode('ascii')
+        
+        # TLS is negotiated with the API host once the tunnel is up
+        connection = http.client.HTTPSConnection(proxy_url.hostname, proxy_url.port, timeout=cls.REQUEST_TIMEOUT)
+        connection.set_tunnel(cls.API_HOST, 443, headers=tunnel_headers)
+        return connection
+    
+    @classmethod
+    def _release_connection(cls, connection):
+        """Keep a connection for the next request, or close it if the pool is full"""
+        with cls._connections_lock:
+            if len(cls._idle_connections) < cls.MAX_IDLE_CONNECTIONS:
+                cls._idle_connections.append(connection)
+                return
+        connection.close()
+    
+    def _get(self, path: str):
+        """
+        Send a GET request to the API over a pooled keep-alive connection
+        
+        Args:
+            path: API path including the query string, e.g. "/get/123"
+        
+        Returns:
+            Tuple of (HTTP status, response body bytes)
+        """
+        connection, reused = self._take_connection()
+        try:
+            response, body = self._send(connection, path)
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            # The server may have dropped an idle connection; retry once on a fresh one
+            if not reused:
+                raise
+            connection = self._new_connection()
+            response, body = self._send(connection, path)
+        
+        if response.will_close:
+            connection.close()
+        else:
+            self._release_connection(connection)
+        
+        location = response.getheader('Location')
+        if response.status in (301, 302, 303, 307, 308) and location:
+            return self._follow_redirect(urllib.parse.urljoin(self.BASE_URL + path, location))
+        return response.status, body
+    
+    def _follow_redirect(self, url: str):
+        """Fetch a redirect target with urllib, which follows any further redirects; returns (status, body)"""
+        request = urllib.request.Request(url, headers=self.session_headers)
+        try:
+            with urllib.request.urlopen(request, timeout=self.REQUEST_TIMEOUT) as response:
+                return response.status, response.read()
+        except urllib.error.HTTPError as e:
+            return e.code, e.read()
+    
+    def _send(self, connection, path: str):
+        """Send one GET request, closing the connection if it fails; returns (response, body)"""
+        try:
+            connection.request('GET', self.API_PATH + path, headers=self.session_headers)
+            response = connection.getresponse()
+            return response, response.read()
+        except (http.client.HTTPException, OSError):
+            connection.close()
+            raise
+    
     def _has_non_latin_chars(self, text: str) -> bool:
         """
         Check if text contains non-Latin characters
@@ -134,47 +233,42 @@ class LRCLibClient:
                 params['duration'] = duration
             
             # Make API request
-            url = f"{self.BASE_URL}/search?" + urllib.parse.urlencode(params)
-            self.logger.debug(f"Searching lyrics: {title} by {artist} - URL: {url}")
+            path = "/search?" + urllib.parse.urlencode(params)
+            self.logger.debug(f"Searching lyrics: {title} by {artist} - URL: {self.BASE_URL}{path}")
             
-            request = urllib.request.Request(url, headers=self.session_headers)
-            
-            with urllib.request.urlopen(request, timeout=10) as response:
-                if response.status == 200:
-                    data = json.loads(response.read().decode('utf-8'))
-                    results = self._parse_search_results(data, title, artist, album, duration)
+            status, body = self._get(path)
+            if status == 200:
+                data = json.loads(body.decode('utf-8'))
+                results = self._parse_search_results(data, title, artist, album, duration)
+                
+                # If no results and try_latin is True, try with Latin names
+                if not results and try_latin:
+                    # Check if artist or title contains non-Latin chars and has parentheses
+                    title_has_non_latin = self._has_non_latin_chars(title)
+                    artist_has_non_latin = self._has_non_latin_chars(artist)
+                    title_has_parentheses = self._has_parentheses_content(title)
+                    artist_has_parentheses = self._has_parentheses_content(artist)
                     
-                    # If no results and try_latin is True, try with Latin names
-                    if not results and try_latin:
-                        # Check if artist or title contains non-Latin chars and has parentheses
-                        title_has_non_latin = self._has_non_latin_chars(title)
-                        artist_has_non_latin = self._has_non_latin_chars(artist)
-                        title_has_parentheses = self._has_parentheses_content(title)
-                        artist_has_parentheses = self._has_parentheses_content(artist)
-                        
-                        should_try_latin = ((title_has_non_latin and title_has_parentheses) or 
-                                          (artist_has_non_latin and artist_has_parentheses))
-                        
-                        if should_try_latin:
-                            latin_title = self._extract_latin_name(title) if title_has_non_latin and title_has_parentheses else title
-                            latin_artist = self._extract_latin_name(artist) if artist_has_non_latin and artist_has_parentheses else artist
-                            latin_album = self._extract_latin_name(album) if album and self._has_non_latin_chars(album) and self._has_parentheses_content(album) else album
-                            
-                            self.logger.info(f"No results found with original names. Trying with Latin names: '{latin_title}' by '{latin_artist}'")
-                            # Recursive call with Latin names, but don't try Latin again to avoid infinite recursion
-                            return self.search_lyrics(latin_title, latin_artist, latin_album, duration, try_latin=False)
+                    should_try_latin = ((title_has_non_latin and title_has_parentheses) or 
+                                      (artist_has_non_latin and artist_has_parentheses))
                     
-                    self.logger.debug(f"Found {len(results)} lyrics results for '{title}' by '{artist}' from LRCLib")
-                    return results
-                else:
-                    self.logger.warning(f"LRCLib API error: HTTP {response.status}")
-                    return []
+                    if should_try_latin:
+                        latin_title = self._extract_latin_name(title) if title_has_non_latin and title_has_parentheses else title
+                        latin_artist = self._extract_latin_name(artist) if artist_has_non_latin and artist_has_parentheses else artist
+                        latin_album = self._extract_latin_name(album) if album and self._has_non_latin_chars(album) and self._has_parentheses_content(album) else album
+                        
+                        self.logger.info(f"No results found with original names. Trying with Latin names: '{latin_title}' by '{latin_artist}'")
+                        # Recursive call with Latin names, but don't try Latin again to avoid infinite recursion
+                        return self.search_lyrics(latin_title, latin_artist, latin_album, duration, try_latin=False)
+                
+                self.logger.debug(f"Found {len(results)} lyrics results for '{title}' by '{artist}' from LRCLib")
+                return results
+            else:
+                self.logger.warning(f"LRCLib API error: HTTP {status}")
+                return []
         
-        except urllib.error.HTTPError as e:
-            self.logger.error(f"LRCLib HTTP error: {e.code} - {e.reason}")
-            return []
-        except urllib.error.URLError as e:
-            self.logger.error(f"LRCLib URL error: {e.reason}")
+        except (http.client.HTTPException, OSError) as e:
+            self.logger.error(f"LRCLib connection error: {e}")
             return []
         except json.JSONDecodeError as e:
             self.logger.error(f"LRCLib JSON decode error: {e}")
@@ -197,27 +291,21 @@ class LRCLibClient:
             # Wait for rate limiting
             self.rate_limiter.wait_if_needed()
             
-            url = f"{self.BASE_URL}/get/{lyrics_id}"
             self.logger.debug(f"Getting lyrics by ID: {lyrics_id}")
-            request = urllib.request.Request(url, headers=self.session_headers)
+            status, body = self._get(f"/get/{lyrics_id}")
             
-            with urllib.request.urlopen(request, timeout=10) as response:
-                if response.status == 200:
-                    data = json.loads(response.read().decode('utf-8'))
-                    result = self._parse_single_result(data)
-                    if result:
-                        self.logger.info(f"Retrieved lyrics by ID: {lyrics_id}")
-                    return result
-                else:
-                    self.logger.warning(f"LRCLib API error: HTTP {response.status}")
-                    return None
-        
-        except urllib.error.HTTPError as e:
-            if e.code == 404:
+            if status == 200:
+                data = json.loads(body.decode('utf-8'))
+                result = self._parse_single_result(data)
+                if result:
+                    self.logger.info(f"Retrieved lyrics by ID: {lyrics_id}")
+                return result
+            elif status == 404:
                 self.logger.info(f"Lyrics not found: {lyrics_id}")
             else:
-                self.logger.error(f"LRCLib HTTP error: {e.code} - {e.reason}")
+                self.logger.error(f"LRCLib HTTP error: {status}")
             return None
+        
         except Exception as e:
             self.logger.exception(f"LRCLib error getting lyrics by ID: {e}")
             return None
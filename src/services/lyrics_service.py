@@ -19,7 +19,7 @@
 
 import threading
 from typing import List, Optional, Callable
-from gi.repository import GObject, GLib
+from gi.repository import GObject, GLib, Gio
 from ..models.lyrics import LyricsResult, LyricsSource
 from .lrclib_client import LRCLibClient
 from .file_service import FileService
@@ -49,10 +49,18 @@ class LyricsService(GObject.Object):
         self.logger = get_logger('lyrics_service')
         self.romanization_service = RomanizationService()
         self.settings_service = SettingsService()
+        
+        # Direct handlers for a single owner; when set they are called
+        # instead of emitting the matching signal
+        self.on_search_completed = None
+        self.on_search_error = None
+        self.on_download_completed = None
+        self.on_download_error = None
+        
         self.logger.info("Lyrics service initialized")
     
     def search_lyrics_async(self, title: str, artist: str, album: str = "", duration: int = 0,
-                           callback: Optional[Callable] = None):
+                           callback: Optional[Callable] = None, cancellable: Optional[Gio.Cancellable] = None):
         """
         Search for lyrics asynchronously
         
@@ -62,19 +70,19 @@ class LyricsService(GObject.Object):
             album: Album name (optional)
             duration: Song duration in seconds (optional)
             callback: Optional callback function to call with results
+            cancellable: Optional Gio.Cancellable; once cancelled no results or errors are delivered
         """
         search_key = f"{artist}_{title}"
         self.logger.info(f"Starting async lyrics search: '{title}' by '{artist}'")
         
-        # Cancel any existing search for this track
+        # Threads can't be cancelled; an earlier search for this track just finishes
         if search_key in self._current_searches:
-            self.logger.debug(f"Cancelling existing search for: {search_key}")
-            self._current_searches[search_key].cancel()
+            self.logger.debug(f"Search already running for: {search_key}")
         
         # Start new search
         search_thread = threading.Thread(
             target=self._search_lyrics_thread,
-            args=(title, artist, album, duration, callback, search_key),
+            args=(title, artist, album, duration, callback, search_key, cancellable),
             daemon=True
         )
         
@@ -82,12 +90,16 @@ class LyricsService(GObject.Object):
         search_thread.start()
     
     def _search_lyrics_thread(self, title: str, artist: str, album: str, duration: int,
-                            callback: Optional[Callable], search_key: str):
+                            callback: Optional[Callable], search_key: str,
+                            cancellable: Optional[Gio.Cancellable]):
         """Thread function for searching lyrics"""
         try:
+            if cancellable is not None and cancellable.is_cancelled():
+                return
+            
             self.logger.debug(f"Search thread started for: '{title}' by '{artist}'")
             # Emit search started signal
-            GLib.idle_add(self.emit, 'search-started', artist, title)
+            GLib.idle_add(self._notify, 'search-started', artist, title)
             
             results = []
             
@@ -103,12 +115,12 @@ class LyricsService(GObject.Object):
             self.logger.info(f"Search completed: found {len(results)} results for '{title}' by '{artist}'")
             
             # Emit results
-            GLib.idle_add(self._emit_search_completed, results, callback)
+            GLib.idle_add(self._deliver, cancellable, self._emit_search_completed, results, callback)
             
         except Exception as e:
             error_msg = f"Search error for {artist} - {title}: {str(e)}"
             self.logger.error(error_msg, exc_info=True)
-            GLib.idle_add(self.emit, 'search-error', error_msg)
+            GLib.idle_add(self._deliver, cancellable, self._notify, 'search-error', error_msg)
         
         finally:
             # Clean up search tracking
@@ -116,37 +128,56 @@ class LyricsService(GObject.Object):
                 self.logger.debug(f"Cleaning up search for: {search_key}")
                 del self._current_searches[search_key]
     
+    def _notify(self, signal_name: str, *args):
+        """Call the direct handler for an event if one is set, else emit its signal"""
+        handler = getattr(self, 'on_' + signal_name.replace('-', '_'), None)
+        if handler is not None:
+            handler(*args)
+        else:
+            self.emit(signal_name, *args)
+        return False
+    
+    def _deliver(self, cancellable: Optional[Gio.Cancellable], func: Callable, *args):
+        """Call func on the main loop unless its operation was cancelled meanwhile"""
+        if cancellable is None or not cancellable.is_cancelled():
+            func(*args)
+        return False
+    
     def _emit_search_completed(self, results: List[LyricsResult], callback: Optional[Callable]):
         """Emit search completed signal and call callback"""
-        self.emit('search-completed', results)
+        self._notify('search-completed', results)
         if callback:
             callback(results)
     
     def download_lyrics_async(self, music_file_path: str, lyrics_result: LyricsResult, 
-                            callback: Optional[Callable] = None):
+                            callback: Optional[Callable] = None, cancellable: Optional[Gio.Cancellable] = None):
         """
         Download and save lyrics to LRC file asynchronously
         
         Args:
             music_file_path: Path to the music file
             lyrics_result: LyricsResult to save
-            callback: Optional callback function
+            callback: Optional callback function, called instead of emitting download-completed
+            cancellable: Optional Gio.Cancellable; once cancelled nothing more is saved or delivered
         """
         self.logger.info(f"Starting lyrics download for: {music_file_path}")
         download_thread = threading.Thread(
             target=self._download_lyrics_thread,
-            args=(music_file_path, lyrics_result, callback),
+            args=(music_file_path, lyrics_result, callback, cancellable),
             daemon=True
         )
         download_thread.start()
     
     def _download_lyrics_thread(self, music_file_path: str, lyrics_result: LyricsResult,
-                              callback: Optional[Callable]):
+                              callback: Optional[Callable], cancellable: Optional[Gio.Cancellable]):
         """Thread function for downloading lyrics"""
         try:
+            if cancellable is not None and cancellable.is_cancelled():
+                return
+            
             self.logger.debug(f"Download thread started for: {music_file_path}")
             # Emit download started signal
-            GLib.idle_add(self.emit, 'download-started', music_file_path)
+            GLib.idle_add(self._notify, 'download-started', music_file_path)
             
             # Generate LRC file path
             lrc_file_path = FileService.get_lrc_file_path(music_file_path)
@@ -165,6 +196,10 @@ class LyricsService(GObject.Object):
                 romanization_mode=self.settings_service.get_romanization_mode()
             )
             
+            # Don't write anything for a download that was cancelled meanwhile
+            if cancellable is not None and cancellable.is_cancelled():
+                return
+            
             # Get storage method preference
             storage_method = self.settings_service.get_lyrics_storage_method()
             success = False
@@ -194,20 +229,21 @@ class LyricsService(GObject.Object):
             if success:
                 saved_location = " and ".join(saved_paths)
                 self.logger.info(f"Successfully saved lyrics to: {saved_location}")
-                # Emit download completed signal
-                GLib.idle_add(self.emit, 'download-completed', music_file_path, saved_location)
-                
+                # Deliver completion once: to the callback when one was
+                # given, otherwise through the download-completed event
                 if callback:
-                    GLib.idle_add(callback, saved_location)
+                    GLib.idle_add(self._deliver, cancellable, callback, saved_location)
+                else:
+                    GLib.idle_add(self._deliver, cancellable, self._notify, 'download-completed', music_file_path, saved_location)
             else:
                 error_msg = f"Failed to save lyrics using method: {storage_method}"
                 self.logger.error(error_msg)
-                GLib.idle_add(self.emit, 'download-error', music_file_path, error_msg)
+                GLib.idle_add(self._deliver, cancellable, self._notify, 'download-error', music_file_path, error_msg)
                 
         except Exception as e:
             error_msg = f"Download error: {str(e)}"
             self.logger.error(f"Download error for {music_file_path}: {error_msg}", exc_info=True)
-            GLib.idle_add(self.emit, 'download-error', music_file_path, error_msg)
+            GLib.idle_add(self._deliver, cancellable, self._notify, 'download-error', music_file_path, error_msg)
     
     def _get_lrc_file_path(self, music_file_path: str) -> str:
         """Get LRC file path for a music file"""
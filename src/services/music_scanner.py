@@ -18,18 +18,29 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import os
+import sys
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from gi.repository import Gio, GLib, GdkPixbuf, GObject
+from gi.repository import GLib, GObject
 import mutagen
+from ..models.music_file import MusicFile
+from .album_art_service import AlbumArtService
 from .logger_service import get_logger
 
+# Worker threads reading tags in parallel; the work is mostly waiting on file I/O
+METADATA_WORKERS = 4
+
+# Scanned files delivered to the main loop per files-found-batch signal
+FOUND_BATCH_SIZE = 128
+
 class MusicScanner(GObject.Object):
     """Service for scanning music directories and extracting metadata"""
     
     __gsignals__ = {
         'scan-started': (GObject.SIGNAL_RUN_FIRST, None, ()),
         'file-found': (GObject.SIGNAL_RUN_FIRST, None, (object,)),
+        'files-found-batch': (GObject.SIGNAL_RUN_FIRST, None, (object,)),
         'scan-progress': (GObject.SIGNAL_RUN_FIRST, None, (int, int)),
         'scan-completed': (GObject.SIGNAL_RUN_FIRST, None, (object,)),
         'scan-error': (GObject.SIGNAL_RUN_FIRST, None, (str,)),
@@ -39,6 +50,9 @@ class MusicScanner(GObject.Object):
         super().__init__()
         self.supported_formats = {'.mp3', '.flac', '.ogg', '.m4a', '.mp4', '.wav', '.wma', '.opus'}
         self._cancel_requested = False
+        self._progress = (0, 0)  # Latest (processed, total) not yet emitted
+        self._progress_pending = False  # Whether a scan-progress idle is queued
+        self._progress_lock = threading.Lock()
         self.logger = get_logger('music_scanner')
         self.logger.info("Music scanner initialized")
     
@@ -59,42 +73,96 @@ class MusicScanner(GObject.Object):
             GLib.idle_add(self.emit, 'scan-started')
             
             music_files = []
-            total_files = 0
+            found_batch = []  # Found files not handed to the main loop yet
             processed_files = 0
             
-            # First pass: count total music files
-            for root, dirs, files in os.walk(directory_path):
+            # Single directory walk; the second pass reuses the collected entries
+            music_entries = []
+            for entry in self._walk_music_files(directory_path):
                 if self._cancel_requested:
                     return
-                for file in files:
-                    if any(file.lower().endswith(ext) for ext in self.supported_formats):
-                        total_files += 1
+                music_entries.append(entry)
+            total_files = len(music_entries)
             
-            # Second pass: process files
-            for root, dirs, files in os.walk(directory_path):
-                if self._cancel_requested:
-                    return
-                    
-                for file in files:
+            # Overlap the header reads of several files; map() keeps scan order
+            with ThreadPoolExecutor(max_workers=METADATA_WORKERS, thread_name_prefix='metadata') as executor:
+                results = executor.map(self._extract_metadata, (entry.path for entry in music_entries))
+                for metadata in results:
                     if self._cancel_requested:
+                        executor.shutdown(wait=False, cancel_futures=True)
                         return
-                        
-                    if any(file.lower().endswith(ext) for ext in self.supported_formats):
-                        file_path = os.path.join(root, file)
-                        metadata = self._extract_metadata(file_path)
-                        
-                        if metadata:
-                            music_files.append(metadata)
-                            GLib.idle_add(self.emit, 'file-found', metadata)
-                        
-                        processed_files += 1
-                        GLib.idle_add(self.emit, 'scan-progress', processed_files, total_files)
+                    
+                    if metadata:
+                        music_files.append(metadata)
+                        found_batch.append(metadata)
+                        if len(found_batch) >= FOUND_BATCH_SIZE:
+                            GLib.idle_add(self._emit_files_found, found_batch)
+                            found_batch = []
+                    
+                    processed_files += 1
+                    self._queue_progress(processed_files, total_files)
             
+            if found_batch:
+                GLib.idle_add(self._emit_files_found, found_batch)
             GLib.idle_add(self.emit, 'scan-completed', music_files)
             
         except Exception as e:
             GLib.idle_add(self.emit, 'scan-error', str(e))
     
+    def _queue_progress(self, processed, total):
+        """Record scan progress and queue one low-priority emission for it"""
+        # Progress is stale-tolerant: a single queued idle reports whatever
+        # is latest when it runs, at a priority below redraws and file batches
+        with self._progress_lock:
+            self._progress = (processed, total)
+            if self._progress_pending:
+                return
+            self._progress_pending = True
+        GLib.idle_add(self._emit_progress, priority=GLib.PRIORITY_LOW)
+    
+    def _emit_progress(self):
+        """Emit the latest recorded scan progress"""
+        with self._progress_lock:
+            self._progress_pending = False
+            processed, total = self._progress
+        self.emit('scan-progress', processed, total)
+        return False
+    
+    def _emit_files_found(self, music_files):
+        """Deliver a batch of found files, one by one only to file-found listeners"""
+        self.emit('files-found-batch', music_files)
+        
+        if GObject.signal_has_handler_pending(self, GObject.signal_lookup('file-found', MusicScanner), 0, False):
+            for music_file in music_files:
+                self.emit('file-found', music_file)
+        return False
+    
+    def _walk_music_files(self, directory_path):
+        """Yield os.DirEntry objects for supported music files, top-down like os.walk"""
+        try:
+            with os.scandir(directory_path) as it:
+                entries = list(it)
+        except OSError as e:
+            self.logger.warning(f"Cannot read directory {directory_path}: {e}")
+            return
+        
+        subdirectories = []
+        for entry in entries:
+            try:
+                # Both checks use the d_type cached from the directory listing,
+                # only symlinks need an extra stat() to resolve their target
+                if entry.is_dir(follow_symlinks=False):
+                    subdirectories.append(entry.path)
+                elif os.path.splitext(entry.name)[1].lower() in self.supported_formats and entry.is_file():
+                    yield entry
+            except OSError:
+                continue
+        
+        for subdirectory in subdirectories:
+            if self._cancel_requested:
+                return
+            yield from self._walk_music_files(subdirectory)
+    
     def _extract_metadata(self, file_path):
         """Extract metadata from music file using mutagen"""
         try:
@@ -107,22 +175,26 @@ class MusicScanner(GObject.Object):
             artist = self._get_tag(audio_file, ['TPE1', 'ARTIST', '\xa9ART']) or "Unknown Artist"
             album = self._get_tag(audio_file, ['TALB', 'ALBUM', '\xa9alb']) or "Unknown Album"
             
+            # Artist and album repeat across many tracks, keep one copy of each
+            artist = sys.intern(str(artist))
+            album = sys.intern(str(album))
+            
             # Get duration
             duration = audio_file.info.length if audio_file.info else 0
             duration_str = self._format_duration(duration)
             
-            # Extract album art
-            album_art = self._extract_album_art(audio_file)
+            # Only note whether artwork exists, it is decoded when a row shows it
+            has_album_art = self._has_album_art(audio_file)
             
-            return {
-                'path': file_path,
-                'title': str(title),
-                'artist': str(artist),
-                'album': str(album),
-                'duration': duration_str,
-                'duration_seconds': duration,
-                'album_art': album_art
-            }
+            return MusicFile(
+                path=file_path,
+                title=str(title),
+                artist=artist,
+                album=album,
+                duration=duration_str,
+                duration_seconds=duration,
+                has_album_art=has_album_art
+            )
         except Exception as e:
             self.logger.error(f"Error extracting metadata from {file_path}: {e}")
             return None
@@ -145,45 +217,10 @@ class MusicScanner(GObject.Object):
         seconds = int(seconds % 60)
         return f"{minutes}:{seconds:02d}"
     
-    def _extract_album_art(self, audio_file):
-        """Extract album art from audio file"""
+    def _has_album_art(self, audio_file):
+        """Check whether the audio file has embedded album art"""
         try:
-            # Try different ways to get album art
-            artwork_data = None
-            
-            # For MP3 files with ID3 tags
-            if hasattr(audio_file, 'tags') and audio_file.tags:
-                for key, value in audio_file.tags.items():
-                    if isinstance(key, str) and key.startswith('APIC'):
-                        artwork_data = value.data
-                        break
-            
-            # For MP4 files
-            if not artwork_data and 'covr' in audio_file:
-                artwork_data = bytes(audio_file['covr'][0])
-            
-            # For FLAC files
-            if not artwork_data and hasattr(audio_file, 'pictures') and audio_file.pictures:
-                artwork_data = audio_file.pictures[0].data
-            
-            # For OGG files
-            if not artwork_data and hasattr(audio_file, 'tags') and audio_file.tags:
-                # Look for METADATA_BLOCK_PICTURE in OGG files
-                if 'METADATA_BLOCK_PICTURE' in audio_file.tags:
-                    import base64
-                    from mutagen.flac import Picture
-                    pic_data = audio_file.tags['METADATA_BLOCK_PICTURE'][0]
-                    pic = Picture(base64.b64decode(pic_data))
-                    artwork_data = pic.data
-            
-            if artwork_data:
-                # Create GdkPixbuf from artwork data
-                input_stream = Gio.MemoryInputStream.new_from_data(artwork_data)
-                pixbuf = GdkPixbuf.Pixbuf.new_from_stream_at_scale(
-                    input_stream, 64, 64, True, None
-                )
-                return pixbuf
+            return AlbumArtService.has_artwork(audio_file)
         except Exception as e:
             self.logger.error(f"Error extracting album art: {e}")
-        
-        return None
+            return False
@@ -41,6 +41,11 @@ try:
 except ImportError:
     HAS_KOREAN_ROMANIZER = False
 
+# Invisible separator used to push several Korean segments through a single
+# Romanizer pass; it is not Hangul, so the romanizer copies it through as-is.
+KOREAN_SEGMENT_SEPARATOR = '\u2063'
+KOREAN_PATTERN = re.compile(r'[\uac00-\ud7af]+')
+
 class RomanizationService(GObject.Object):
     """Service for romanizing lyrics in Chinese, Japanese, and Korean"""
     
@@ -160,8 +165,42 @@ class RomanizationService(GObject.Object):
             self.logger.error(f"Korean romanization failed: {e}")
             return None
     
+    def romanize_korean_batch(self, segments) -> dict:
+        """
+        Romanize many Korean segments with a single Romanizer pass
+        
+        Args:
+            segments: Iterable of Hangul-only segments
+            
+        Returns:
+            Dictionary mapping each segment to its romanized text
+        """
+        if not HAS_KOREAN_ROMANIZER or not self.korean_romanizer:
+            return {}
+        
+        unique_segments = list(dict.fromkeys(segments))
+        if not unique_segments:
+            return {}
+        
+        try:
+            joined = Romanizer(KOREAN_SEGMENT_SEPARATOR.join(unique_segments)).romanize()
+            romanized = joined.split(KOREAN_SEGMENT_SEPARATOR)
+            if len(romanized) == len(unique_segments):
+                return dict(zip(unique_segments, romanized))
+            self.logger.debug("Korean batch romanization lost segment boundaries, romanizing per segment")
+        except Exception as e:
+            self.logger.debug(f"Korean batch romanization failed, romanizing per segment: {e}")
+        
+        results = {}
+        for segment in unique_segments:
+            romanized_segment = self.romanize_korean(segment)
+            if romanized_segment:
+                results[segment] = romanized_segment
+        return results
+    
     def romanize_text(self, text: str, romanize_chinese: bool = True, 
-                     romanize_japanese: bool = True, romanize_korean: bool = True) -> str:
+                     romanize_japanese: bool = True, romanize_korean: bool = True,
+                     korean_segments: Optional[dict] = None) -> str:
         """
         Romanize text containing multiple languages
         
@@ -170,6 +209,7 @@ class RomanizationService(GObject.Object):
             romanize_chinese: Whether to romanize Chinese characters
             romanize_japanese: Whether to romanize Japanese characters
             romanize_korean: Whether to romanize Korean characters
+            korean_segments: Optional pre-romanized Korean segments (see romanize_korean_batch)
             
         Returns:
             Text with romanized portions
@@ -188,9 +228,13 @@ class RomanizationService(GObject.Object):
                 result = self._replace_script_in_text(result, japanese_romanized, 'japanese')
         
         if romanize_korean and self._contains_korean(text):
-            korean_romanized = self.romanize_korean(text)
-            if korean_romanized:
-                result = self._replace_script_in_text(result, korean_romanized, 'korean')
+            if korean_segments is not None:
+                result = KOREAN_PATTERN.sub(
+                    lambda m: korean_segments.get(m.group()) or m.group(), result)
+            else:
+                korean_romanized = self.romanize_korean(text)
+                if korean_romanized:
+                    result = self._replace_script_in_text(result, korean_romanized, 'korean')
         
         return result
     
@@ -217,6 +261,11 @@ class RomanizationService(GObject.Object):
         lines = lyrics.split('\n')
         result_lines = []
         
+        # Romanize every Korean segment of the song in one pass up front
+        korean_segments = None
+        if romanize_korean and HAS_KOREAN_ROMANIZER and self._contains_korean(lyrics):
+            korean_segments = self.romanize_korean_batch(KOREAN_PATTERN.findall(lyrics))
+        
         for line in lines:
             original_line = line
             
@@ -232,7 +281,8 @@ class RomanizationService(GObject.Object):
             
             # Romanize the text part
             romanized_text = self.romanize_text(
-                text_part, romanize_chinese, romanize_japanese, romanize_korean
+                text_part, romanize_chinese, romanize_japanese, romanize_korean,
+                korean_segments=korean_segments
             )
             
             if mode == 'replace':
@@ -260,8 +310,7 @@ class RomanizationService(GObject.Object):
             return re.sub(r'[\u3040-\u309f\u30a0-\u30ff]+', 
                          lambda m: self.romanize_japanese(m.group()) or m.group(), original)
         elif script_type == 'korean' and self._contains_korean(original):
-            return re.sub(r'[\uac00-\ud7af]+', 
-                         lambda m: self.romanize_korean(m.group()) or m.group(), original)
+            return KOREAN_PATTERN.sub(lambda m: self.romanize_korean(m.group()) or m.group(), original)
         
         return original
     
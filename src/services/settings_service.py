@@ -17,11 +17,14 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from gi.repository import Gio, GObject
-from typing import List
+import threading
+from gi.repository import Gio, GLib, GObject
+from typing import Any, Dict, List
 from ..models.lyrics import LyricsSource
 from .logger_service import get_logger
 
+_SOURCE_BY_VALUE = {source.value: source for source in LyricsSource}
+
 class SettingsService(GObject.Object):
     """Service for managing application settings"""
     
@@ -34,6 +37,14 @@ class SettingsService(GObject.Object):
     def __init__(self, schema_id: str = "id.ngoding.Composer"):
         super().__init__()
         self.logger = get_logger('settings_service')
+        
+        # Parsed setting values, keyed by GSettings key; getters also run on
+        # worker threads, so a read only fills the cache if no invalidation
+        # happened while it was reading
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+        self._cache_generation = 0
+        
         try:
             self.settings = Gio.Settings.new(schema_id)
             self.settings.connect('changed', self._on_settings_changed)
@@ -43,29 +54,70 @@ class SettingsService(GObject.Object):
     
     def _on_settings_changed(self, settings, key):
         """Handle settings change"""
+        self._invalidate(key)
         self.emit('settings-changed', key)
     
+    def _invalidate(self, *keys):
+        """Drop cached values for keys (all values if none are given)"""
+        with self._cache_lock:
+            self._cache_generation += 1
+            if keys:
+                for key in keys:
+                    self._cache.pop(key, None)
+            else:
+                self._cache.clear()
+    
+    def _lookup_cached(self, key: str):
+        """Return (cached value or None, generation to pass to _store_cached)"""
+        with self._cache_lock:
+            return self._cache.get(key), self._cache_generation
+    
+    def _store_cached(self, key: str, value, generation: int):
+        """Cache a value read at generation, unless it was invalidated since"""
+        with self._cache_lock:
+            if generation == self._cache_generation:
+                self._cache[key] = value
+    
+    def _get_cached(self, key: str, read, default):
+        """Return the cached value for key, reading it from GSettings on a miss"""
+        cached, generation = self._lookup_cached(key)
+        if cached is not None:
+            return cached
+        
+        try:
+            value = read(key)
+        except Exception as e:
+            self.logger.error(f"Error reading {key} setting: {e}")
+            return default
+        
+        self._store_cached(key, value, generation)
+        return value
+    
     def get_lyrics_sources_priority(self) -> List[LyricsSource]:
         """Get the priority order of lyrics sources"""
         if not self.settings:
             return [LyricsSource.LRCLIB]
         
+        cached, generation = self._lookup_cached('lyrics-sources-priority')
+        if cached is not None:
+            return list(cached)
+        
         try:
             source_strings = self.settings.get_strv('lyrics-sources-priority')
-            sources = []
+            sources = [source for source in map(_SOURCE_BY_VALUE.get, source_strings) if source is not None]
             
-            for source_str in source_strings:
-                try:
-                    source = LyricsSource(source_str)
-                    sources.append(source)
-                except ValueError:
+            if len(sources) != len(source_strings):
+                for source_str in set(source_strings).difference(_SOURCE_BY_VALUE):
                     self.logger.warning(f"Unknown lyrics source in settings: {source_str}")
+            elif sources:
+                # Only cache exact parses so the setter can compare against what is stored
+                self._store_cached('lyrics-sources-priority', sources, generation)
             
             # Fallback to default if no valid sources
             if not sources:
                 sources = [LyricsSource.LRCLIB]
             
-            return sources
+            return list(sources)
         except Exception as e:
             self.logger.error(f"Error reading lyrics sources priority: {e}")
             return [LyricsSource.LRCLIB]
@@ -75,9 +127,13 @@ class SettingsService(GObject.Object):
         if not self.settings:
             return
         
+        if self._lookup_cached('lyrics-sources-priority')[0] == list(sources):
+            return
+        
         try:
             source_strings = [source.value for source in sources]
             self.settings.set_strv('lyrics-sources-priority', source_strings)
+            self._invalidate('lyrics-sources-priority')
         except Exception as e:
             self.logger.error(f"Error setting lyrics sources priority: {e}")
     
@@ -86,11 +142,7 @@ class SettingsService(GObject.Object):
         if not self.settings:
             return False
         
-        try:
-            return self.settings.get_boolean('auto-download-lyrics')
-        except Exception as e:
-            self.logger.error(f"Error reading auto-download-lyrics setting: {e}")
-            return False
+        return self._get_cached('auto-download-lyrics', self.settings.get_boolean, False)
     
     def set_auto_download_lyrics(self, enabled: bool):
         """Set whether to automatically download lyrics when scanning"""
@@ -99,6 +151,7 @@ class SettingsService(GObject.Object):
         
         try:
             self.settings.set_boolean('auto-download-lyrics', enabled)
+            self._invalidate('auto-download-lyrics')
         except Exception as e:
             self.logger.error(f"Error setting auto-download-lyrics: {e}")
     
@@ -107,11 +160,7 @@ class SettingsService(GObject.Object):
         if not self.settings:
             return False
         
-        try:
-            return self.settings.get_boolean('overwrite-existing-lyrics')
-        except Exception as e:
-            self.logger.error(f"Error reading overwrite-existing-lyrics setting: {e}")
-            return False
+        return self._get_cached('overwrite-existing-lyrics', self.settings.get_boolean, False)
     
     def set_overwrite_existing_lyrics(self, enabled: bool):
         """Set whether to overwrite existing lyrics files"""
@@ -120,6 +169,7 @@ class SettingsService(GObject.Object):
         
         try:
             self.settings.set_boolean('overwrite-existing-lyrics', enabled)
+            self._invalidate('overwrite-existing-lyrics')
         except Exception as e:
             self.logger.error(f"Error setting overwrite-existing-lyrics: {e}")
     
@@ -128,11 +178,7 @@ class SettingsService(GObject.Object):
         if not self.settings:
             return "en"
         
-        try:
-            return self.settings.get_string('lyrics-language')
-        except Exception as e:
-            self.logger.error(f"Error reading lyrics-language setting: {e}")
-            return "en"
+        return self._get_cached('lyrics-language', self.settings.get_string, "en")
     
     def set_lyrics_language(self, language: str):
         """Set preferred lyrics language"""
@@ -141,6 +187,7 @@ class SettingsService(GObject.Object):
         
         try:
             self.settings.set_string('lyrics-language', language)
+            self._invalidate('lyrics-language')
         except Exception as e:
             self.logger.error(f"Error setting lyrics-language: {e}")
     
@@ -149,11 +196,7 @@ class SettingsService(GObject.Object):
         if not self.settings:
             return "lrc"
         
-        try:
-            return self.settings.get_string('lyrics-storage-method')
-        except Exception as e:
-            self.logger.error(f"Error reading lyrics-storage-method setting: {e}")
-            return "lrc"
+        return self._get_cached('lyrics-storage-method', self.settings.get_string, "lrc")
     
     def set_lyrics_storage_method(self, method: str):
         """Set preferred lyrics storage method"""
@@ -162,6 +205,7 @@ class SettingsService(GObject.Object):
         
         try:
             self.settings.set_string('lyrics-storage-method', method)
+            self._invalidate('lyrics-storage-method')
             # Invalidate FileService cache when storage method changes
             from .file_service import FileService
             FileService._invalidate_cache()
@@ -173,11 +217,7 @@ class SettingsService(GObject.Object):
         if not self.settings:
             return False
         
-        try:
-            return self.settings.get_boolean('enable-romanization')
-        except Exception as e:
-            self.logger.error(f"Error reading enable-romanization setting: {e}")
-            return False
+        return self._get_cached('enable-romanization', self.settings.get_boolean, False)
     
     def set_enable_romanization(self, enabled: bool):
         """Set whether romanization is enabled"""
@@ -186,6 +226,7 @@ class SettingsService(GObject.Object):
         
         try:
             self.settings.set_boolean('enable-romanization', enabled)
+            self._invalidate('enable-romanization')
         except Exception as e:
             self.logger.error(f"Error setting enable-romanization: {e}")
     
@@ -194,11 +235,7 @@ class SettingsService(GObject.Object):
         if not self.settings:
             return True
         
-        try:
-            return self.settings.get_boolean('romanize-chinese')
-        except Exception as e:
-            self.logger.error(f"Error reading romanize-chinese setting: {e}")
-            return True
+        return self._get_cached('romanize-chinese', self.settings.get_boolean, True)
     
     def set_romanize_chinese(self, enabled: bool):
         """Set whether to romanize Chinese lyrics"""
@@ -207,6 +244,7 @@ class SettingsService(GObject.Object):
         
         try:
             self.settings.set_boolean('romanize-chinese', enabled)
+            self._invalidate('romanize-chinese')
         except Exception as e:
             self.logger.error(f"Error setting romanize-chinese: {e}")
     
@@ -215,11 +253,7 @@ class SettingsService(GObject.Object):
         if not self.settings:
             return True
         
-        try:
-            return self.settings.get_boolean('romanize-japanese')
-        except Exception as e:
-            self.logger.error(f"Error reading romanize-japanese setting: {e}")
-            return True
+        return self._get_cached('romanize-japanese', self.settings.get_boolean, True)
     
     def set_romanize_japanese(self, enabled: bool):
         """Set whether to romanize Japanese lyrics"""
@@ -228,6 +262,7 @@ class SettingsService(GObject.Object):
         
         try:
             self.settings.set_boolean('romanize-japanese', enabled)
+            self._invalidate('romanize-japanese')
         except Exception as e:
             self.logger.error(f"Error setting romanize-japanese: {e}")
     
@@ -236,11 +271,7 @@ class SettingsService(GObject.Object):
         if not self.settings:
             return True
         
-        try:
-            return self.settings.get_boolean('romanize-korean')
-        except Exception as e:
-            self.logger.error(f"Error reading romanize-korean setting: {e}")
-            return True
+        return self._get_cached('romanize-korean', self.settings.get_boolean, True)
     
     def set_romanize_korean(self, enabled: bool):
         """Set whether to romanize Korean lyrics"""
@@ -249,6 +280,7 @@ class SettingsService(GObject.Object):
         
         try:
             self.settings.set_boolean('romanize-korean', enabled)
+            self._invalidate('romanize-korean')
         except Exception as e:
             self.logger.error(f"Error setting romanize-korean: {e}")
     
@@ -257,11 +289,7 @@ class SettingsService(GObject.Object):
         if not self.settings:
             return "replace"
         
-        try:
-            return self.settings.get_string('romanization-mode')
-        except Exception as e:
-            self.logger.error(f"Error reading romanization-mode setting: {e}")
-            return "replace"
+        return self._get_cached('romanization-mode', self.settings.get_string, "replace")
     
     def set_romanization_mode(self, mode: str):
         """Set romanization mode ('replace' or 'multiline')"""
@@ -270,27 +298,106 @@ class SettingsService(GObject.Object):
         
         try:
             self.settings.set_string('romanization-mode', mode)
+            self._invalidate('romanization-mode')
         except Exception as e:
             self.logger.error(f"Error setting romanization-mode: {e}")
 
+    def get_max_concurrent_downloads(self) -> int:
+        """Get how many lyrics auto-downloads may run at the same time"""
+        if not self.settings:
+            return 4
+        
+        return self._get_cached('max-concurrent-downloads', self.settings.get_int, 4)
+    
+    def set_max_concurrent_downloads(self, count: int):
+        """Set how many lyrics auto-downloads may run at the same time"""
+        if not self.settings:
+            return
+        
+        try:
+            self.settings.set_int('max-concurrent-downloads', count)
+            self._invalidate('max-concurrent-downloads')
+        except Exception as e:
+            self.logger.error(f"Error setting max-concurrent-downloads: {e}")
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Read all lyrics-related settings at once.
+        
+        Returns:
+            Mapping of GSettings key to its current value
+        """
+        return {
+            'lyrics-sources-priority': self.get_lyrics_sources_priority(),
+            'auto-download-lyrics': self.get_auto_download_lyrics(),
+            'overwrite-existing-lyrics': self.get_overwrite_existing_lyrics(),
+            'lyrics-language': self.get_lyrics_language(),
+            'lyrics-storage-method': self.get_lyrics_storage_method(),
+            'enable-romanization': self.get_enable_romanization(),
+            'romanize-chinese': self.get_romanize_chinese(),
+            'romanize-japanese': self.get_romanize_japanese(),
+            'romanize-korean': self.get_romanize_korean(),
+            'romanization-mode': self.get_romanization_mode(),
+            'max-concurrent-downloads': self.get_max_concurrent_downloads(),
+        }
+    
+    def apply(self, values: Dict[str, Any]):
+        """
+        Write several settings in one batch.
+        
+        Args:
+            values: Mapping of GSettings key to its new Python value
+        """
+        if not self.settings or not values:
+            return
+        
+        try:
+            # Same delay-apply batch object as reset_to_defaults, so the whole
+            # mapping is committed as a single write
+            batch = Gio.Settings.new(self.settings.props.schema_id)
+            batch.delay()
+            for key, value in values.items():
+                type_string = self.settings.get_value(key).get_type_string()
+                batch.set_value(key, GLib.Variant(type_string, value))
+            batch.apply()
+        except Exception as e:
+            self.logger.error(f"Error applying settings {', '.join(values)}: {e}")
+        finally:
+            self._invalidate(*values)
+            if 'lyrics-storage-method' in values:
+                # Invalidate FileService cache when storage method changes
+                from .file_service import FileService
+                FileService._invalidate_cache()
+    
     def reset_to_defaults(self):
         """Reset all lyrics-related settings to their defaults"""
         if not self.settings:
             return
         
         try:
-            self.settings.reset('lyrics-sources-priority')
-            self.settings.reset('auto-download-lyrics')
-            self.settings.reset('overwrite-existing-lyrics')
-            self.settings.reset('lyrics-language')
-            self.settings.reset('lyrics-storage-method')
-            self.settings.reset('enable-romanization')
-            self.settings.reset('romanize-chinese')
-            self.settings.reset('romanize-japanese')
-            self.settings.reset('romanize-korean')
-            self.settings.reset('romanization-mode')
+            # Stage the resets on a delay-apply settings object so they are written
+            # (and notified) as one change; delay mode cannot be left once entered,
+            # so keep it off self.settings
+            batch = Gio.Settings.new(self.settings.props.schema_id)
+            batch.delay()
+            batch.reset('lyrics-sources-priority')
+            batch.reset('auto-download-lyrics')
+            batch.reset('overwrite-existing-lyrics')
+            batch.reset('lyrics-language')
+            batch.reset('lyrics-storage-method')
+            batch.reset('enable-romanization')
+            batch.reset('romanize-chinese')
+            batch.reset('romanize-japanese')
+            batch.reset('romanize-korean')
+            batch.reset('romanization-mode')
+            batch.reset('max-concurrent-downloads')
+            batch.apply()
         except Exception as e:
             self.logger.error(f"Error resetting settings: {e}")
+        finally:
+            self._invalidate()
+            from .file_service import FileService
+            FileService._invalidate_cache()
     
     def has_settings(self) -> bool:
         """Check if settings are available"""
@@ -17,14 +17,93 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from gi.repository import Adw, Gtk, GObject, GLib
+from gi.repository import Adw, Gtk, GObject, GLib, Gio
 import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from collections import OrderedDict
+from ..models.music_file import MusicFile
 from ..services.lyrics_service import LyricsService
 from ..services.settings_service import SettingsService
 from ..services.file_service import FileService
+from ..services.album_art_service import AlbumArtService
 from ..services.logger_service import get_logger
 from .lyrics_selection_dialog import LyricsSelectionDialog
 
+# Number of files whose lyrics status is checked per background batch
+PREFETCH_BATCH_SIZE = 128
+
+# Above this many changed files one full re-sort beats moving them one by one
+RESORT_THRESHOLD = 256
+
+# Number of lyrics searches remembered for tracks with the same tags
+SEARCH_CACHE_SIZE = 512
+
+class MusicRow(Adw.ActionRow):
+    """Reusable library row, bound to a music file by the list factory"""
+    
+    __gtype_name__ = 'MusicRow'
+    
+    def __init__(self):
+        super().__init__()
+        self.music_file = None  # Item currently bound to this row
+        
+        # Show tags as plain text so they never need markup escaping
+        self.set_use_markup(False)
+        
+        # Album art, or a fallback icon, shares a single prefix image
+        self.prefix_image = Gtk.Image()
+        self.prefix_image.set_pixel_size(56)
+        self.prefix_image.add_css_class('music-row-prefix')
+        self.prefix_image.set_valign(Gtk.Align.CENTER)
+        self.add_prefix(self.prefix_image)
+        
+        # Create suffix container for duration and download button
+        suffix_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
+        suffix_box.set_spacing(8)
+        suffix_box.set_valign(Gtk.Align.CENTER)
+        
+        self.duration_label = Gtk.Label()
+        self.duration_label.add_css_class('dim-label')
+        self.duration_label.add_css_class('caption')
+        self.duration_label.set_valign(Gtk.Align.CENTER)
+        suffix_box.append(self.duration_label)
+        
+        # Download button stays sensitive even for dimmed rows
+        self.download_button = Gtk.Button()
+        self.download_button.add_css_class('flat')
+        self.download_button.set_valign(Gtk.Align.CENTER)
+        suffix_box.append(self.download_button)
+        
+        self.add_suffix(suffix_box)
+        
+        self.showing_album_art = False
+        self.prefix_image.set_from_icon_name('audio-x-generic-symbolic')
+        self.prefix_image.add_css_class('dim-label')
+    
+    def show_fallback_icon(self):
+        """Show the generic audio icon instead of album art"""
+        if not self.showing_album_art:
+            return
+        self.showing_album_art = False
+        self.prefix_image.set_from_icon_name('audio-x-generic-symbolic')
+        self.prefix_image.remove_css_class('card')
+        self.prefix_image.add_css_class('dim-label')
+    
+    def show_album_art(self, texture):
+        """Show decoded album art"""
+        self.showing_album_art = True
+        self.prefix_image.set_from_paintable(texture)
+        self.prefix_image.remove_css_class('dim-label')
+        self.prefix_image.add_css_class('card')
+    
+    def release(self):
+        """Reset the row to its unbound state so the list view can reuse it"""
+        self.music_file = None
+        # Drop the album art texture with the binding
+        self.show_fallback_icon()
+
 class LibraryView(Gtk.Box):
     """Library view showing music collection"""
     
@@ -34,8 +113,11 @@ class LibraryView(Gtk.Box):
         'directory-selected': (GObject.SIGNAL_RUN_FIRST, None, (str,)),
         'lyrics-downloaded': (GObject.SIGNAL_RUN_FIRST, None, (str, str)),
         'lyrics-error': (GObject.SIGNAL_RUN_FIRST, None, (str, str)),
+        'lyrics-status-checked': (GObject.SIGNAL_RUN_FIRST, None, ()),
     }
     
+    _prefetch_executor = None  # Shared worker for lyrics status prefetches
+    
     def __init__(self):
         super().__init__(orientation=Gtk.Orientation.VERTICAL)
         self.set_spacing(12)
@@ -44,25 +126,35 @@ class LibraryView(Gtk.Box):
         self.set_margin_start(24)
         self.set_margin_end(24)
         
-        self.music_files = []
-        self.displayed_paths = set()  # Track displayed file paths to avoid duplicates
-        self.pending_files = []  # Queue for files to be added to UI
-        self.update_timer_id = None  # Timer for batched UI updates
+        # Files are kept in scan order; the sort model puts files without
+        # lyrics first and the list view only creates rows for visible items
+        self.store = Gio.ListStore.new(MusicFile)
+        self.sorter = Gtk.CustomSorter.new(self._compare_lyrics_status)
+        self.sort_model = Gtk.SortListModel.new(self.store, self.sorter)
+        self.scanning = False  # While scanning the list stays in scan order
+        self.files_by_path = {}  # music_file_path -> MusicFile, also guards against duplicates
+        self.store_positions = {}  # music_file_path -> position in the scan-ordered store
+        self.list_generation = 0  # Bumped on clear so late lyrics checks of an old list are dropped
+        self.shown_scan_progress = None  # (processed, total) currently on the scan progress bar
+        self.shown_auto_download_progress = None  # (completed, total) currently on the auto-download bar
+        self.pending_moves = set()  # Paths of files waiting to be re-sorted
+        self.move_source_id = None  # Timeout source for debounced re-sorting
+        self.search_cache = OrderedDict()  # Search key -> results, least recently used first
         
         # Initialize services
         self.lyrics_service = LyricsService()
         self.settings_service = SettingsService()
         self.logger = get_logger('library_view')
         
-        # Track download states for each music file
-        self.download_states = {}  # music_file_path -> download_button
-        self.persistent_button_states = {}  # music_file_path -> state (for preserving across refreshes)
+        # Rows currently bound to a file; download states live on the items.
+        # Weak values so a row torn down without an unbind isn't kept alive
+        self.bound_rows = weakref.WeakValueDictionary()  # music_file_path -> MusicRow
         
-        # Connect lyrics service signals
-        self.lyrics_service.connect('search-completed', self._on_lyrics_search_completed)
-        self.lyrics_service.connect('search-error', self._on_lyrics_search_error)
-        self.lyrics_service.connect('download-completed', self._on_lyrics_download_completed)
-        self.lyrics_service.connect('download-error', self._on_lyrics_download_error)
+        # The view owns this lyrics service, so take its events directly
+        self.lyrics_service.on_search_completed = self._on_lyrics_search_completed
+        self.lyrics_service.on_search_error = self._on_lyrics_search_error
+        self.lyrics_service.on_download_completed = self._on_lyrics_download_completed
+        self.lyrics_service.on_download_error = self._on_lyrics_download_error
         
         self._setup_ui()
     
@@ -108,34 +200,29 @@ class LibraryView(Gtk.Box):
         header_clamp.set_child(header_box)
         self.append(header_clamp)
         
-        # Progress bar container (initially hidden)
-        self.progress_container = Adw.Clamp()
-        self.progress_container.set_maximum_size(1000)
-        self.progress_container.set_margin_start(12)
-        self.progress_container.set_margin_end(12)
-        self.progress_container.set_margin_bottom(12)
+        # Scanning and auto-downloading never overlap, so both progress bars
+        # share one revealer and a stack (initially hidden)
+        self.progress_stack = Gtk.Stack()
         
         self.progress_bar = Gtk.ProgressBar()
         self.progress_bar.set_show_text(True)
-        
-        self.progress_container.set_child(self.progress_bar)
-        self.progress_container.set_visible(False)
-        self.append(self.progress_container)
-        
-        # Auto-download progress bar container (initially hidden)
-        self.auto_download_container = Adw.Clamp()
-        self.auto_download_container.set_maximum_size(1000)
-        self.auto_download_container.set_margin_start(12)
-        self.auto_download_container.set_margin_end(12)
-        self.auto_download_container.set_margin_bottom(12)
+        self.progress_stack.add_named(self.progress_bar, 'scan')
         
         self.auto_download_bar = Gtk.ProgressBar()
         self.auto_download_bar.set_show_text(True)
         self.auto_download_bar.add_css_class('osd')
+        self.progress_stack.add_named(self.auto_download_bar, 'auto-download')
+        
+        progress_clamp = Adw.Clamp()
+        progress_clamp.set_maximum_size(1000)
+        progress_clamp.add_css_class('library-progress')
+        progress_clamp.set_child(self.progress_stack)
         
-        self.auto_download_container.set_child(self.auto_download_bar)
-        self.auto_download_container.set_visible(False)
-        self.append(self.auto_download_container)
+        self.progress_revealer = Gtk.Revealer()
+        self.progress_revealer.set_child(progress_clamp)
+        self.progress_revealer.set_visible(False)
+        self.progress_revealer.connect('notify::child-revealed', self._on_progress_child_revealed)
+        self.append(self.progress_revealer)
         
         # Music list container
         scrolled = Gtk.ScrolledWindow()
@@ -144,14 +231,19 @@ class LibraryView(Gtk.Box):
         scrolled.set_min_content_height(400)
         scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
         
-        clamp = Adw.Clamp()
+        clamp = Adw.ClampScrollable()
         clamp.set_maximum_size(1000)
         clamp.set_margin_start(12)
         clamp.set_margin_end(12)
         
-        self.music_list = Gtk.ListBox()
-        self.music_list.set_selection_mode(Gtk.SelectionMode.NONE)
-        self.music_list.add_css_class('boxed-list')
+        factory = Gtk.SignalListItemFactory()
+        factory.connect('setup', self._on_factory_setup)
+        factory.connect('bind', self._on_factory_bind)
+        factory.connect('unbind', self._on_factory_unbind)
+        
+        self.music_list = Gtk.ListView.new(Gtk.NoSelection.new(self.sort_model), factory)
+        self.music_list.set_show_separators(True)
+        self.music_list.add_css_class('card')
         self.music_list.set_margin_top(6)
         self.music_list.set_margin_bottom(6)
         
@@ -178,192 +270,205 @@ class LibraryView(Gtk.Box):
         toplevel = self.get_root()
         dialog.select_folder(toplevel, None, on_response)
     
+    def _show_progress(self, name):
+        """Reveal one of the progress bars"""
+        self.progress_stack.set_visible_child_name(name)
+        self.progress_revealer.set_visible(True)
+        self.progress_revealer.set_reveal_child(True)
+    
+    def _on_progress_child_revealed(self, revealer, pspec):
+        """Take the hidden revealer out of the layout once it has closed"""
+        if not revealer.get_child_revealed() and not revealer.get_reveal_child():
+            revealer.set_visible(False)
+    
     def set_scanning_state(self, is_scanning=True):
         """Update UI to show scanning state"""
         if is_scanning:
             self.subtitle_label.set_text('Scanning for music files...')
-            self.progress_container.set_visible(True)
+            self.shown_scan_progress = None
+            self.shown_auto_download_progress = None
+            self._show_progress('scan')
+            
+            # Files stream in unsorted; sorting once at the end is cheaper
+            # than re-sorting on every status the prefetch reports
+            self.scanning = True
+            self.sort_model.set_sorter(None)
         else:
-            self.progress_container.set_visible(False)
+            self.progress_revealer.set_reveal_child(False)
+            
+            if self.scanning:
+                self.scanning = False
+                self.pending_moves.clear()
+                self.sort_model.set_sorter(self.sorter)
     
     def update_scan_progress(self, processed, total):
         """Update scan progress"""
+        # The scanner already coalesces progress; only skip redundant redraws
+        if (processed, total) == self.shown_scan_progress:
+            return
+        self.shown_scan_progress = (processed, total)
+        
         if total > 0:
             fraction = processed / total
             self.progress_bar.set_fraction(fraction)
             self.progress_bar.set_text(f'Scanned {processed} of {total} files')
     
     def add_music_file(self, music_file):
-        """Add a single music file to the list with progressive display"""
-        # Add to internal list
-        self.music_files.append(music_file)
-        
-        # Skip if already displayed (shouldn't happen but be safe)
-        if music_file['path'] in self.displayed_paths:
+        """Add a single music file to the list"""
+        self.add_music_files_batch([music_file])
+    
+    def add_music_files_batch(self, music_files):
+        """Add scanned MusicFile items to the list with a single model notification"""
+        # Skip files already displayed (shouldn't happen but be safe)
+        items = []
+        for item in music_files:
+            if item.path in self.files_by_path:
+                continue
+            self.files_by_path[item.path] = item
+            items.append(item)
+        if not items:
             return
         
-        # Add to pending files for batched processing
-        self.pending_files.append(music_file)
-        
-        # Schedule UI update if not already scheduled
-        if self.update_timer_id is None:
-            # Use a short delay to batch multiple file additions
-            self.update_timer_id = GLib.timeout_add(50, self._process_pending_files)
-    
-    def _process_pending_files(self):
-        """Process pending files and add them to the UI"""
-        if not self.pending_files:
-            self.update_timer_id = None
-            return False  # Remove the timer
-        
-        # Process up to 10 files at a time to avoid UI freezes
-        batch_size = min(10, len(self.pending_files))
-        files_to_process = self.pending_files[:batch_size]
-        self.pending_files = self.pending_files[batch_size:]
-        
-        for music_file in files_to_process:
-            if music_file['path'] not in self.displayed_paths:
-                # Create and add row immediately (without lyrics check for speed)
-                row = self._create_music_row(music_file)
-                self.music_list.append(row)
-                self.displayed_paths.add(music_file['path'])
-                
-                # Update subtitle to show current count
-                current_count = len(self.displayed_paths)
-                if current_count == 1:
-                    self.subtitle_label.set_text(f'Found {current_count} song (scanning...)')
-                else:
-                    self.subtitle_label.set_text(f'Found {current_count} songs (scanning...)')
-        
-        # Continue processing if there are more files
-        if self.pending_files:
-            return True  # Keep the timer running
+        # Files are only ever appended, so store positions never shift.
+        # The sorter is detached while scanning, so the splice costs no re-sort;
+        # outside a scan a large batch is sorted once instead of item by item
+        start = self.store.get_n_items()
+        for offset, item in enumerate(items):
+            self.store_positions[item.path] = start + offset
+        if not self.scanning and len(items) > RESORT_THRESHOLD:
+            self.sort_model.set_sorter(None)
+            self.store.splice(start, 0, items)
+            self.sort_model.set_sorter(self.sorter)
+        else:
+            self.store.splice(start, 0, items)
+        
+        # Look up lyrics status in the background so binding never hits the disk
+        for offset in range(0, len(items), PREFETCH_BATCH_SIZE):
+            self._prefetch_lyrics_states([item.path for item in items[offset:offset + PREFETCH_BATCH_SIZE]])
+        
+        # Update subtitle to show current count
+        current_count = self.store.get_n_items()
+        if not self.scanning:
+            self._set_library_subtitle(current_count)
+        elif current_count == 1:
+            self.subtitle_label.set_text(f'Found {current_count} song (scanning...)')
         else:
-            self.update_timer_id = None
-            return False  # Remove the timer
+            self.subtitle_label.set_text(f'Found {current_count} songs (scanning...)')
+    
+    def _set_library_subtitle(self, total_files, files_with_lyrics=0):
+        """Show the library size, and how many files have lyrics if any do"""
+        if total_files == 1:
+            self.subtitle_label.set_text('1 song in your library')
+        elif files_with_lyrics > 0:
+            self.subtitle_label.set_text(f'{total_files} songs in your library ({files_with_lyrics} with lyrics)')
+        else:
+            self.subtitle_label.set_text(f'{total_files} songs in your library')
+    
+    def _prefetch_lyrics_states(self, file_paths):
+        """Check lyrics status of newly added files on the prefetch worker"""
+        generation = self.list_generation
+        
+        def check_lyrics_background():
+            # Skip batches queued for a library that has since been cleared
+            if generation != self.list_generation:
+                return
+            try:
+                lyrics_status = FileService.lyrics_exist_bulk(file_paths)
+                GLib.idle_add(self._apply_lyrics_states, lyrics_status, generation)
+            except Exception as e:
+                self.logger.error(f"Error prefetching lyrics status: {e}")
+        
+        self._get_prefetch_executor().submit(check_lyrics_background)
+    
+    @classmethod
+    def _get_prefetch_executor(cls):
+        """Get the worker that checks lyrics status of added files"""
+        # One worker keeps checks from piling up on large libraries and
+        # applies their results in the order the files were added
+        if cls._prefetch_executor is None:
+            cls._prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='lyrics-prefetch')
+        return cls._prefetch_executor
+    
+    def _apply_lyrics_states(self, lyrics_status, generation):
+        """Record prefetched lyrics status on files still in the library"""
+        if generation != self.list_generation:
+            return False
+        for path, has_lyrics in lyrics_status.items():
+            music_file = self.files_by_path.get(path)
+            if music_file is not None and music_file.has_lyrics is None:
+                self._move_row(music_file, has_lyrics)
+        return False
     
     def _refresh_music_list_async(self):
         """Asynchronously refresh the music list with proper sorting and lyrics checking"""
-        if not self.music_files:
+        if not self.store.get_n_items():
             return
         
         # Show that we're checking lyrics
         self.subtitle_label.set_text("Checking lyrics availability...")
         
+        # Only files the prefetch hasn't covered yet need checking
+        file_paths = [item.path for item in self.store if item.has_lyrics is None]
+        
+        generation = self.list_generation
+        
         # Perform lyrics checking in a background thread
         def check_lyrics_background():
             try:
-                file_paths = [f['path'] for f in self.music_files]
                 lyrics_status = FileService.lyrics_exist_bulk(file_paths)
                 
                 # Update UI on main thread
-                GLib.idle_add(self._update_rows_with_lyrics_status, lyrics_status)
+                GLib.idle_add(self._update_rows_with_lyrics_status, lyrics_status, generation)
             except Exception as e:
                 self.logger.error(f"Error checking lyrics: {e}")
                 # Fallback to individual checks
                 lyrics_status = {}
-                for f in self.music_files:
+                for path in file_paths:
                     try:
-                        lyrics_status[f['path']] = FileService.lyrics_exist(f['path'])
+                        lyrics_status[path] = FileService.lyrics_exist(path)
                     except:
-                        lyrics_status[f['path']] = False
-                GLib.idle_add(self._update_rows_with_lyrics_status, lyrics_status)
+                        lyrics_status[path] = False
+                GLib.idle_add(self._update_rows_with_lyrics_status, lyrics_status, generation)
         
         # Start background thread
         thread = threading.Thread(target=check_lyrics_background, daemon=True)
         thread.start()
     
-    def _update_rows_with_lyrics_status(self, lyrics_status):
-        """Update existing rows with lyrics status and reorder them"""
+    def _update_rows_with_lyrics_status(self, lyrics_status, generation):
+        """Update items with lyrics status and reorder them"""
+        # The list was cleared for another directory while checking
+        if generation != self.list_generation:
+            return False
+        
         try:
-            # Save current button states before recreating rows
-            current_button_states = {}
-            for path, button in self.download_states.items():
-                if button.has_css_class('destructive-action'):
-                    current_button_states[path] = 'error'
-                elif button.has_css_class('success'):
-                    current_button_states[path] = 'complete'
-                elif not button.get_sensitive():
-                    current_button_states[path] = 'downloading'
-                else:
-                    current_button_states[path] = 'idle'
-            
-            # Merge with persistent states (persistent states take precedence)
-            for path, state in self.persistent_button_states.items():
-                current_button_states[path] = state
-            
-            # Collect all current rows with their music files
-            rows_data = []
-            child = self.music_list.get_first_child()
-            
-            while child:
-                if hasattr(child, 'music_file'):
-                    music_file = child.music_file
-                    has_lyrics = lyrics_status.get(music_file['path'], False)
-                    rows_data.append((music_file, has_lyrics, child))
-                child = child.get_next_sibling()
-            
-            # Sort: files without lyrics first, then files with lyrics
-            rows_data.sort(key=lambda x: x[1])  # Sort by has_lyrics (False first)
-            
-            # Remove all rows from the list
-            while True:
-                row = self.music_list.get_first_child()
-                if row is None:
-                    break
-                self.music_list.remove(row)
-            
-            # Clear download states before recreating
-            self.download_states.clear()
-            
-            # Re-add rows in sorted order with updated styling
-            for music_file, has_lyrics, old_row in rows_data:
-                # Create new row with proper lyrics status
-                new_row = self._create_music_row_with_status(music_file, has_lyrics)
-                self.music_list.append(new_row)
-                
-                # Restore button state if it was saved
-                file_path = music_file['path']
-                if file_path in current_button_states:
-                    saved_state = current_button_states[file_path]
-                    self._set_download_button_state(file_path, saved_state, skip_refresh=True)
+            # Record the lyrics status on each checked item; only files whose
+            # status changed get re-sorted, the rest of the order is kept as is
+            for path, has_lyrics in lyrics_status.items():
+                music_file = self.files_by_path.get(path)
+                if music_file is not None:
+                    self._move_row(music_file, has_lyrics)
             
             # Update subtitle
-            total_files = len(self.music_files)
-            files_with_lyrics = sum(1 for _, has_lyrics, _ in rows_data if has_lyrics)
-            
-            if total_files == 1:
-                self.subtitle_label.set_text('1 song in your library')
-            else:
-                if files_with_lyrics > 0:
-                    self.subtitle_label.set_text(f'{total_files} songs in your library ({files_with_lyrics} with lyrics)')
-                else:
-                    self.subtitle_label.set_text(f'{total_files} songs in your library')
+            items = list(self.store)
+            total_files = len(items)
+            files_with_lyrics = sum(1 for item in items if item.has_lyrics)
+            self._set_library_subtitle(total_files, files_with_lyrics)
                 
         except Exception as e:
             self.logger.error(f"Error updating rows with lyrics status: {e}")
             # Fallback to simple count
-            total_files = len(self.music_files)
-            if total_files == 1:
-                self.subtitle_label.set_text('1 song in your library')
-            else:
-                self.subtitle_label.set_text(f'{total_files} songs in your library')
+            self._set_library_subtitle(self.store.get_n_items())
         
+        # Every file now has a known lyrics status
+        self.emit('lyrics-status-checked')
         return False  # Don't repeat this idle callback
     
     def set_scan_completed(self, total_files):
         """Update UI when scan is completed"""
+        # The caller has added every scanned file by now, so the list
+        # is sorted once by leaving the scanning state
         self.set_scanning_state(False)
         
-        # Cancel any pending timer
-        if self.update_timer_id is not None:
-            GLib.source_remove(self.update_timer_id)
-            self.update_timer_id = None
-        
-        # Process any remaining pending files
-        if self.pending_files:
-            self._process_pending_files()
-        
         if total_files == 0:
             self.subtitle_label.set_text('No music files found in this directory')
         else:
@@ -372,148 +477,147 @@ class LibraryView(Gtk.Box):
     
     def clear_music_list(self):
         """Clear all music files from the list"""
-        self.music_files = []
-        self.displayed_paths.clear()
-        self.pending_files.clear()
-        self.download_states.clear()
-        self.persistent_button_states.clear()
-        
-        # Cancel any pending timer
-        if self.update_timer_id is not None:
-            GLib.source_remove(self.update_timer_id)
-            self.update_timer_id = None
-        
-        # Clear the UI list
-        while True:
-            row = self.music_list.get_first_child()
-            if row is None:
-                break
-            self.music_list.remove(row)
-    
-    def _create_music_row(self, music_file):
-        """Create a row for a music file (without lyrics status check)"""
-        return self._create_music_row_with_status(music_file, has_lyrics=None)
-    
-    def _create_music_row_with_status(self, music_file, has_lyrics=None):
-        """Create a row for a music file with optional lyrics status"""
-        import html
-        
-        row = Adw.ActionRow()
-        # Escape HTML entities to prevent markup parsing errors
-        safe_title = html.escape(music_file['title'])
-        safe_artist = html.escape(music_file['artist'])
-        safe_album = html.escape(music_file['album'])
-        
-        row.set_title(safe_title)
-        row.set_subtitle(f"{safe_artist} • {safe_album}")
-        
-        # Store music file data in row for later access
-        row.music_file = music_file
-        
-        # Create suffix container for duration and download button
-        suffix_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
-        suffix_box.set_spacing(8)
-        suffix_box.set_valign(Gtk.Align.CENTER)
-        
-        # Create duration label
-        duration_label = Gtk.Label()
-        duration_label.set_text(music_file['duration'])
-        duration_label.add_css_class('dim-label')
-        duration_label.add_css_class('caption')
-        duration_label.set_valign(Gtk.Align.CENTER)
-        suffix_box.append(duration_label)
+        self.list_generation += 1
+        self.files_by_path.clear()
+        self.store_positions.clear()
+        self.bound_rows.clear()
+        
+        # Cancel any pending updates
+        if self.move_source_id is not None:
+            GLib.source_remove(self.move_source_id)
+            self.move_source_id = None
+        self.pending_moves.clear()
+        
+        # Clear the UI list with a single model notification, without the
+        # sort model having to track the removal of every sorted item
+        if self.scanning:
+            self.store.remove_all()
+        else:
+            self.sort_model.set_sorter(None)
+            self.store.remove_all()
+            self.sort_model.set_sorter(self.sorter)
         
-        # Check lyrics status if not provided
-        if has_lyrics is None:
-            has_lyrics = FileService.lyrics_exist(music_file['path'])
+        # Artwork of the previous library won't be shown again
+        AlbumArtService.clear_cache()
+    
+    def _on_factory_setup(self, factory, list_item):
+        """Create a reusable row widget"""
+        row = MusicRow()
+        row.download_button.connect('clicked', self._on_row_download_clicked, row)
+        list_item.set_activatable(False)
+        list_item.set_child(row)
+    
+    def _on_factory_bind(self, factory, list_item):
+        """Show a music file in a recycled row"""
+        row = list_item.get_child()
+        music_file = list_item.get_item()
+        row.music_file = music_file
         
-        # Apply dimmed styling if lyrics exist
-        if has_lyrics:
-            row.add_css_class('dim-label')
-            # Add additional visual styling to make the dimming more noticeable
-            row.set_opacity(0.6)
+        row.set_title(music_file.title)
+        row.set_subtitle(music_file.subtitle)
+        row.duration_label.set_text(music_file.duration)
         
-        # Create download button with appropriate icon
-        download_button = Gtk.Button()
-        if has_lyrics:
-            download_button.set_icon_name('view-refresh-symbolic')
-            download_button.set_tooltip_text('Re-download Lyrics')
-        else:
-            download_button.set_icon_name('folder-download-symbolic')
-            download_button.set_tooltip_text('Download Lyrics')
-        
-        download_button.add_css_class('flat')
-        download_button.set_valign(Gtk.Align.CENTER)
-        download_button.connect('clicked', self._on_download_lyrics_clicked, music_file)
-        
-        # Make download button always sensitive even for dimmed rows
-        download_button.set_sensitive(True)
-        
-        # Store button reference for state updates
-        self.download_states[music_file['path']] = download_button
-        
-        suffix_box.append(download_button)
-        row.add_suffix(suffix_box)
-        
-        # Add album art if available
-        if music_file['album_art']:
-            album_art_box = Gtk.Box()
-            album_art_box.set_margin_start(8)
-            album_art_box.set_margin_top(8)
-            album_art_box.set_margin_bottom(8)
-            album_art_box.set_margin_end(8)
-            album_art_box.set_valign(Gtk.Align.CENTER)
-            
-            album_art = Gtk.Picture()
-            album_art.set_pixbuf(music_file['album_art'])
-            album_art.set_size_request(56, 56)
-            album_art.add_css_class('card')
-            album_art_box.append(album_art)
-            
-            row.add_prefix(album_art_box)
-        else:
-            # Use fallback icon with consistent sizing
-            icon_box = Gtk.Box()
-            icon_box.set_margin_start(8)
-            icon_box.set_margin_top(8)
-            icon_box.set_margin_bottom(8)
-            icon_box.set_margin_end(8)
-            icon_box.set_valign(Gtk.Align.CENTER)
-            
-            fallback_icon = Gtk.Image()
-            fallback_icon.set_from_icon_name('audio-x-generic-symbolic')
-            fallback_icon.set_pixel_size(56)
-            fallback_icon.add_css_class('dim-label')
-            icon_box.append(fallback_icon)
-            
-            row.add_prefix(icon_box)
+        # An unknown lyrics status is filled in by the background prefetch
+        self._apply_row_state(row, music_file)
         
-        return row
+        # Recycled rows were reset to the fallback icon on unbind
+        if music_file.has_album_art:
+            cache_key = self._album_art_key(music_file)
+            found, texture = AlbumArtService.get_cached(cache_key)
+            if found:
+                # Set cached art right away so scrolling doesn't flash the icon
+                self._set_row_album_art(row, music_file, texture)
+            else:
+                # Decode artwork only for rows that are actually shown
+                AlbumArtService.load_album_art_async(
+                    music_file.path,
+                    partial(self._set_row_album_art, row, music_file),
+                    cache_key=cache_key
+                )
+        
+        self.bound_rows[music_file.path] = row
+    
+    def _on_factory_unbind(self, factory, list_item):
+        """Release a row before it is recycled"""
+        row = list_item.get_child()
+        music_file = row.music_file
+        if music_file is not None and self.bound_rows.get(music_file.path) is row:
+            del self.bound_rows[music_file.path]
+        row.release()
+    
+    @staticmethod
+    def _album_art_key(music_file):
+        """Key under which tracks of the same album share one texture"""
+        if music_file.album == 'Unknown Album':
+            return music_file.path
+        return (music_file.artist, music_file.album)
+    
+    def _set_row_album_art(self, row, music_file, texture):
+        """Replace the fallback icon with decoded album art"""
+        # The row may have been recycled for another file meanwhile
+        if texture is not None and row.music_file is music_file:
+            row.show_album_art(texture)
+        return False
+    
+    def _on_row_download_clicked(self, button, row):
+        """Forward a row's download button click for its bound file"""
+        if row.music_file is not None:
+            self._on_download_lyrics_clicked(button, row.music_file)
+    
+    def _apply_row_state(self, row, music_file):
+        """Apply lyrics styling and download button state to a row"""
+        self._apply_row_lyrics_style(row, music_file.has_lyrics)
+        self._apply_button_state(row.download_button, music_file.download_state, music_file.has_lyrics)
     
     def _on_download_lyrics_clicked(self, button, music_file):
         """Handle download lyrics button click"""
-        self.logger.info(f"Download lyrics requested for: '{music_file['title']}' by '{music_file['artist']}'")
+        self.logger.info(f"Download lyrics requested for: '{music_file.title}' by '{music_file.artist}'")
         
         # Update button state to downloading
-        self._set_download_button_state(music_file['path'], 'downloading')
+        self._set_download_button_state(music_file.path, 'downloading')
+        
+        # Tracks with the same tags (duplicates, other encodings) share results
+        search_key = self._search_key(music_file)
+        cached_results = self.search_cache.get(search_key)
+        if cached_results is not None:
+            self.search_cache.move_to_end(search_key)
+            self._handle_lyrics_search_results(music_file.path, cached_results)
+            return
         
         # Start lyrics search
         self.lyrics_service.search_lyrics_async(
-            title=music_file['title'],
-            artist=music_file['artist'],
-            album=music_file['album'],
-            duration=int(music_file.get('duration_seconds', 0)),
-            callback=lambda results: self._handle_lyrics_search_results(music_file, results)
+            title=music_file.title,
+            artist=music_file.artist,
+            album=music_file.album,
+            duration=int(music_file.duration_seconds or 0),
+            callback=partial(self._handle_lyrics_search_results, music_file.path)
         )
     
-    def _handle_lyrics_search_results(self, music_file, results):
+    @staticmethod
+    def _search_key(music_file):
+        """Key for lyrics searches, with the duration rounded to 5 seconds"""
+        return (music_file.title.lower(), music_file.artist.lower(), int(music_file.duration_seconds or 0) // 5)
+    
+    def _handle_lyrics_search_results(self, music_file_path, results):
         """Handle lyrics search results"""
+        # Ignore results for files that left the library while searching
+        music_file = self.files_by_path.get(music_file_path)
+        if music_file is None:
+            return
+        
         if not results:
             # No lyrics found
-            self._set_download_button_state(music_file['path'], 'error')
-            self.emit('lyrics-error', music_file['path'], 'No lyrics found')
+            self._set_download_button_state(music_file.path, 'error')
+            self.emit('lyrics-error', music_file.path, 'No lyrics found')
             return
         
+        # Remember the results, evicting the least recently used search
+        search_key = self._search_key(music_file)
+        self.search_cache[search_key] = results
+        self.search_cache.move_to_end(search_key)
+        if len(self.search_cache) > SEARCH_CACHE_SIZE:
+            self.search_cache.popitem(last=False)
+        
         if len(results) == 1:
             # Single result, download directly
             self._download_lyrics(music_file, results[0])
@@ -524,9 +628,9 @@ class LibraryView(Gtk.Box):
     def _download_lyrics(self, music_file, lyrics_result):
         """Download and save lyrics"""
         self.lyrics_service.download_lyrics_async(
-            music_file_path=music_file['path'],
+            music_file_path=music_file.path,
             lyrics_result=lyrics_result,
-            callback=lambda lrc_path: self._on_lyrics_saved(music_file['path'], lrc_path)
+            callback=partial(self._on_lyrics_saved, music_file.path)
         )
     
     def _show_lyrics_selection_dialog(self, music_file, results):
@@ -534,8 +638,8 @@ class LibraryView(Gtk.Box):
         dialog = LyricsSelectionDialog(
             music_file=music_file,
             lyrics_results=results,
-            callback=lambda selected_result: self._download_lyrics(music_file, selected_result),
-            cancel_callback=lambda: self._on_lyrics_selection_cancelled(music_file)
+            callback=partial(self._download_lyrics, music_file),
+            cancel_callback=partial(self._on_lyrics_selection_cancelled, music_file)
         )
         
         # Present dialog with proper parent
@@ -546,31 +650,44 @@ class LibraryView(Gtk.Box):
     def _on_lyrics_selection_cancelled(self, music_file):
         """Handle lyrics selection dialog cancellation"""
         # Reset download button state to idle
-        self._set_download_button_state(music_file['path'], 'idle')
+        self._set_download_button_state(music_file.path, 'idle')
     
     def _on_lyrics_saved(self, music_file_path, lrc_path):
         """Handle successful lyrics save"""
         self._set_download_button_state(music_file_path, 'complete')
         self.emit('lyrics-downloaded', music_file_path, lrc_path)
     
-    def _set_download_button_state(self, music_file_path, state, skip_refresh=False):
+    def _set_download_button_state(self, music_file_path, state):
         """Update download button state"""
-        if music_file_path not in self.download_states:
+        music_file = self.files_by_path.get(music_file_path)
+        if music_file is None:
             return
         
-        button = self.download_states[music_file_path]
-        has_lyrics = FileService.lyrics_exist(music_file_path)
+        # Lyrics were just written for a completed download, check again then
+        has_lyrics = self._has_lyrics(music_file, refresh=(state == 'complete'))
         
-        # Store persistent state for error conditions to preserve across refreshes
-        if state == 'error':
-            self.persistent_button_states[music_file_path] = 'error'
-        elif state == 'complete':
-            # Clear any persistent error state when successfully completed
-            self.persistent_button_states.pop(music_file_path, None)
-        elif state == 'idle':
-            # Clear persistent state when manually reset to idle
-            self.persistent_button_states.pop(music_file_path, None)
+        # Move just this file into its sorted place for a new lyrics status
+        if state == 'complete':
+            self._move_row(music_file, has_lyrics)
+        
+        # The state is kept on the item so it survives row recycling
+        music_file.download_state = state
         
+        row = self.bound_rows.get(music_file_path)
+        if row is not None:
+            self._apply_button_state(row.download_button, state, has_lyrics)
+    
+    def _has_lyrics(self, music_file, refresh=False):
+        """Get the lyrics status of a file, checking the disk only when unknown"""
+        if refresh or music_file.has_lyrics is None:
+            has_lyrics = FileService.lyrics_exist(music_file.path)
+            if music_file.has_lyrics is None:
+                music_file.has_lyrics = has_lyrics
+            return has_lyrics
+        return music_file.has_lyrics
+    
+    def _apply_button_state(self, button, state, has_lyrics):
+        """Set the icon, tooltip and style of a download button"""
         if state == 'idle':
             if has_lyrics:
                 button.set_icon_name('view-refresh-symbolic')
@@ -593,9 +710,6 @@ class LibraryView(Gtk.Box):
             button.set_sensitive(True)
             button.add_css_class('success')
             button.remove_css_class('destructive-action')
-            # Only refresh if not skipping (to avoid infinite loops during refresh)
-            if not skip_refresh:
-                self._refresh_music_list_async()
         elif state == 'error':
             if has_lyrics:
                 button.set_icon_name('view-refresh-symbolic')
@@ -607,63 +721,104 @@ class LibraryView(Gtk.Box):
             button.remove_css_class('success')
             button.add_css_class('destructive-action')
     
-    def _on_lyrics_search_completed(self, service, results):
-        """Handle lyrics service search completed signal"""
+    @staticmethod
+    def _compare_lyrics_status(a, b, *user_data):
+        """Sort order of the list: files without lyrics first"""
+        return int(bool(a.has_lyrics)) - int(bool(b.has_lyrics))
+    
+    def _move_row(self, music_file, has_lyrics):
+        """Re-sort a single file for a new lyrics status"""
+        if music_file.has_lyrics == has_lyrics:
+            return
+        
+        # An unknown status already sorts as "no lyrics"
+        needs_move = bool(music_file.has_lyrics) != bool(has_lyrics)
+        music_file.has_lyrics = has_lyrics
+        row = self.bound_rows.get(music_file.path)
+        if row is not None:
+            self._apply_row_state(row, music_file)
+        if not needs_move or self.scanning:
+            return
+        
+        # Batch the actual reordering so a burst of downloads moves rows once
+        self.pending_moves.add(music_file.path)
+        if self.move_source_id is None:
+            self.move_source_id = GLib.timeout_add(150, self._apply_pending_moves)
+    
+    def _apply_pending_moves(self):
+        """Re-sort all files whose lyrics status changed"""
+        self.move_source_id = None
+        if len(self.pending_moves) > RESORT_THRESHOLD:
+            # Cheaper to let the sort model redo the whole order at once
+            self.sorter.changed(Gtk.SorterChange.DIFFERENT)
+            self.pending_moves.clear()
+            return False
+        
+        for path in self.pending_moves:
+            position = self.store_positions.get(path)
+            if position is not None:
+                # Replacing the item makes the sort model re-insert just this one
+                self.store.splice(position, 1, [self.store.get_item(position)])
+        self.pending_moves.clear()
+        return False
+    
+    def _on_lyrics_search_completed(self, results):
+        """Handle lyrics service search completed event"""
         # This will be handled by the callback in search_lyrics_async
         pass
     
-    def _on_lyrics_search_error(self, service, error_message):
-        """Handle lyrics service search error signal"""
+    def _on_lyrics_search_error(self, error_message):
+        """Handle lyrics service search error event"""
         self.logger.error(f"Lyrics search error: {error_message}")
         # TODO: Update UI to show error state
     
-    def _on_lyrics_download_completed(self, service, music_file_path, lrc_path):
-        """Handle lyrics service download completed signal"""
+    def _on_lyrics_download_completed(self, music_file_path, lrc_path):
+        """Handle lyrics service download completed event"""
         self._set_download_button_state(music_file_path, 'complete')
         self.emit('lyrics-downloaded', music_file_path, lrc_path)
     
-    def _on_lyrics_download_error(self, service, music_file_path, error_message):
-        """Handle lyrics service download error signal"""
+    def _on_lyrics_download_error(self, music_file_path, error_message):
+        """Handle lyrics service download error event"""
         self._set_download_button_state(music_file_path, 'error')
         self.emit('lyrics-error', music_file_path, error_message)
     
     def set_auto_download_state(self, is_downloading, completed=0, total=0):
         """Update UI to show auto-download state"""
         if is_downloading and total > 0:
-            self.auto_download_container.set_visible(True)
+            # Skip redrawing the bar when the counts didn't change
+            if (completed, total) == self.shown_auto_download_progress:
+                return
+            if self.shown_auto_download_progress is None:
+                self._show_progress('auto-download')
+            self.shown_auto_download_progress = (completed, total)
+            
+            # Only move the bar when the change covers at least a pixel
             fraction = completed / total
-            self.auto_download_bar.set_fraction(fraction)
+            width = self.auto_download_bar.get_width()
+            if width <= 0 or abs(fraction - self.auto_download_bar.get_fraction()) * width >= 1 or completed == total:
+                self.auto_download_bar.set_fraction(fraction)
             self.auto_download_bar.set_text(f'Auto-downloading lyrics: {completed} of {total}')
         else:
-            self.auto_download_container.set_visible(False)
+            self.progress_revealer.set_reveal_child(False)
+            self.shown_auto_download_progress = None
     
     def refresh_file_row(self, music_file_path):
         """Refresh a specific file row to update its appearance"""
-        # Find the music file in our list
-        music_file = None
-        for file in self.music_files:
-            if file['path'] == music_file_path:
-                music_file = file
-                break
-        
-        if not music_file:
+        music_file = self.files_by_path.get(music_file_path)
+        if music_file is None:
             return
         
-        # Find the corresponding row in the list
-        child = self.music_list.get_first_child()
-        while child:
-            if hasattr(child, 'music_file') and child.music_file['path'] == music_file_path:
-                # Update the row's appearance
-                has_lyrics = FileService.lyrics_exist(music_file_path)
-                if has_lyrics:
-                    child.add_css_class('dim-label')
-                    child.set_opacity(0.6)
-                else:
-                    child.remove_css_class('dim-label')
-                    child.set_opacity(1.0)
-                
-                # Only reset to idle if there's no persistent error state
-                if music_file_path not in self.persistent_button_states:
-                    self._set_download_button_state(music_file_path, 'idle')
-                break
-            child = child.get_next_sibling()
+        self._move_row(music_file, self._has_lyrics(music_file, refresh=True))
+        
+        # Only reset to idle if there's no error state to keep
+        if music_file.download_state != 'error':
+            self._set_download_button_state(music_file_path, 'idle')
+    
+    def _apply_row_lyrics_style(self, row, has_lyrics):
+        """Dim rows of files that already have lyrics"""
+        if has_lyrics:
+            row.add_css_class('dim-label')
+            row.set_opacity(0.6)
+        else:
+            row.remove_css_class('dim-label')
+            row.set_opacity(1.0)
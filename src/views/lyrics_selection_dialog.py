@@ -17,16 +17,131 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from gi.repository import Adw, Gtk, GObject
+from gi.repository import Adw, Gtk, GObject, GLib, Gio
 from typing import List, Optional, Callable
+from collections import OrderedDict
 from ..models.lyrics import LyricsResult
+from ..models.music_file import MusicFile
+
+# Number of filled preview buffers kept while switching between results
+PREVIEW_CACHE_SIZE = 16
+
+# Lyrics lines put into the preview at once; more follow while scrolling
+PREVIEW_CHUNK_LINES = 200
+
+# Style of the accuracy badge by minimum percentage, best first
+ACCURACY_CLASSES = ((80, 'success'), (60, 'warning'), (0, 'error'))
+
+def _result_display_texts(result: LyricsResult) -> tuple:
+    """Everything a result row shows, computed once per result"""
+    accuracy_percent = int(result.accuracy_score * 100)
+    accuracy_class = next((css_class for minimum, css_class in ACCURACY_CLASSES if accuracy_percent >= minimum), 'error')
+    return (
+        result.title,
+        f"{accuracy_percent}%",
+        accuracy_class,
+        f"{result.artist} • {result.album}",
+        result.get_display_duration(),
+        result.has_synced_lyrics(),
+        f"• {result.source.value}",
+    )
+
+# Widget tree of a result row, parsed by Gtk.Builder instead of built call by call
+RESULT_ROW_UI = """
+<interface>
+  <object class="GtkBox" id="title_box">
+    <property name="orientation">horizontal</property>
+    <property name="spacing">8</property>
+    <child>
+      <object class="GtkLabel" id="title_label">
+        <property name="halign">start</property>
+        <property name="hexpand">true</property>
+        <style><class name="heading"/></style>
+      </object>
+    </child>
+    <child>
+      <object class="GtkLabel" id="accuracy_label">
+        <style><class name="caption"/></style>
+      </object>
+    </child>
+  </object>
+  <object class="GtkLabel" id="artist_label">
+    <property name="halign">start</property>
+    <style><class name="dim-label"/></style>
+  </object>
+  <object class="GtkBox" id="info_box">
+    <property name="orientation">horizontal</property>
+    <property name="spacing">12</property>
+    <child>
+      <object class="GtkLabel" id="duration_label">
+        <style><class name="caption"/></style>
+      </object>
+    </child>
+    <child>
+      <object class="GtkLabel" id="synced_label">
+        <property name="label">• Synced</property>
+        <style><class name="caption"/><class name="success"/></style>
+      </object>
+    </child>
+    <child>
+      <object class="GtkLabel" id="source_label">
+        <style><class name="caption"/></style>
+      </object>
+    </child>
+  </object>
+</interface>
+"""
+
+class LyricsResultRow(Gtk.Box):
+    """Reusable row showing a lyrics result, bound by the list factory"""
+    
+    __gtype_name__ = 'LyricsResultRow'
+    
+    def __init__(self):
+        super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=6,
+                         margin_top=12, margin_bottom=12, margin_start=12, margin_end=12)
+        
+        builder = Gtk.Builder.new_from_string(RESULT_ROW_UI, -1)
+        
+        # Title and accuracy indicator
+        self.title_label = builder.get_object('title_label')
+        self.accuracy_label = builder.get_object('accuracy_label')
+        self.accuracy_class = None  # Style class currently on the accuracy badge
+        self.append(builder.get_object('title_box'))
+        
+        # Artist and album
+        self.artist_label = builder.get_object('artist_label')
+        self.append(self.artist_label)
+        
+        # Duration and type info
+        self.duration_label = builder.get_object('duration_label')
+        self.synced_label = builder.get_object('synced_label')
+        self.source_label = builder.get_object('source_label')
+        self.append(builder.get_object('info_box'))
+    
+    def bind(self, texts: tuple):
+        """Show the display texts of a lyrics result in this row"""
+        title, accuracy, accuracy_class, artist_album, duration, is_synced, source = texts
+        self.title_label.set_text(title)
+        
+        self.accuracy_label.set_text(accuracy)
+        if accuracy_class != self.accuracy_class:
+            if self.accuracy_class:
+                self.accuracy_label.remove_css_class(self.accuracy_class)
+            self.accuracy_label.add_css_class(accuracy_class)
+            self.accuracy_class = accuracy_class
+        
+        self.artist_label.set_text(artist_album)
+        self.duration_label.set_text(duration)
+        self.synced_label.set_visible(is_synced)
+        self.source_label.set_text(source)
 
 class LyricsSelectionDialog(Adw.Dialog):
     """Dialog for selecting lyrics from multiple search results"""
     
     __gtype_name__ = 'LyricsSelectionDialog'
     
-    def __init__(self, music_file: dict, lyrics_results: List[LyricsResult], 
+    def __init__(self, music_file: MusicFile, lyrics_results: List[LyricsResult], 
                  callback: Optional[Callable] = None, cancel_callback: Optional[Callable] = None):
         super().__init__()
         
@@ -35,11 +150,17 @@ class LyricsSelectionDialog(Adw.Dialog):
         self.callback = callback
         self.cancel_callback = cancel_callback
         self.selected_result = None
+        self.previewed_result = None  # Result whose lyrics the preview shows
+        self.preview_buffers = OrderedDict()  # LyricsResult -> filled Gtk.TextBuffer
+        self.preview_source_id = None  # Idle source for the deferred preview update
+        self.preview_pending_lines = {}  # Gtk.TextBuffer -> lyrics lines not shown yet
         
         self.set_title("Choose Lyrics")
         self.set_content_width(700)
         self.set_content_height(500)
         
+        self.connect('closed', self._on_closed)
+        
         self._build_ui()
     
     def _build_ui(self):
@@ -56,21 +177,15 @@ class LyricsSelectionDialog(Adw.Dialog):
         header_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
         header_box.set_spacing(6)
         
-        title_label = Gtk.Label()
-        title_label.set_markup(f"<span size='large' weight='bold'>{self.music_file['title']}</span>")
-        title_label.set_halign(Gtk.Align.START)
+        title_label = Gtk.Label(label=self.music_file.title, halign=Gtk.Align.START, css_classes=['title-3'])
         header_box.append(title_label)
         
-        subtitle_label = Gtk.Label()
-        subtitle_label.set_text(f"by {self.music_file['artist']} • {self.music_file['album']}")
-        subtitle_label.set_halign(Gtk.Align.START)
-        subtitle_label.add_css_class('dim-label')
+        subtitle_label = Gtk.Label(label=f"by {self.music_file.artist} • {self.music_file.album}",
+                                   halign=Gtk.Align.START, css_classes=['dim-label'])
         header_box.append(subtitle_label)
         
-        info_label = Gtk.Label()
-        info_label.set_text(f"Found {len(self.lyrics_results)} lyrics options. Choose the best match:")
-        info_label.set_halign(Gtk.Align.START)
-        info_label.add_css_class('caption')
+        info_label = Gtk.Label(label=f"Found {len(self.lyrics_results)} lyrics options. Choose the best match:",
+                               halign=Gtk.Align.START, css_classes=['caption'])
         header_box.append(info_label)
         
         main_box.append(header_box)
@@ -85,15 +200,24 @@ class LyricsSelectionDialog(Adw.Dialog):
         left_scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
         left_scrolled.set_min_content_width(300)
         
-        self.results_list = Gtk.ListBox()
-        self.results_list.set_selection_mode(Gtk.SelectionMode.SINGLE)
-        self.results_list.add_css_class('boxed-list')
-        self.results_list.connect('row-selected', self._on_result_selected)
+        # Results are shown by a list view, which only creates rows for
+        # the visible results and reuses them while scrolling
+        self.results_store = Gio.ListStore.new(LyricsResult)
+        self.results_store.splice(0, 0, self.lyrics_results)
+        
+        # Row texts are formatted when a result is first shown and kept,
+        # so rebinding rows while scrolling never formats them again
+        self.display_texts = {}  # LyricsResult -> display texts tuple
+        
+        self.selection = Gtk.SingleSelection.new(self.results_store)
+        
+        factory = Gtk.SignalListItemFactory()
+        factory.connect('setup', self._on_factory_setup)
+        factory.connect('bind', self._on_factory_bind)
         
-        # Populate results list
-        for result in self.lyrics_results:
-            row = self._create_result_row(result)
-            self.results_list.append(row)
+        self.results_list = Gtk.ListView.new(self.selection, factory)
+        self.results_list.set_show_separators(True)
+        self.results_list.add_css_class('card')
         
         left_scrolled.set_child(self.results_list)
         paned.set_start_child(left_scrolled)
@@ -103,15 +227,13 @@ class LyricsSelectionDialog(Adw.Dialog):
         right_box.set_spacing(12)
         right_box.set_margin_start(12)
         
-        preview_label = Gtk.Label()
-        preview_label.set_text("Preview")
-        preview_label.set_halign(Gtk.Align.START)
-        preview_label.add_css_class('heading')
+        preview_label = Gtk.Label(label="Preview", halign=Gtk.Align.START, css_classes=['heading'])
         right_box.append(preview_label)
         
         preview_scrolled = Gtk.ScrolledWindow()
         preview_scrolled.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
         preview_scrolled.set_vexpand(True)
+        preview_scrolled.get_vadjustment().connect('value-changed', self._on_preview_scrolled)
         
         self.preview_text = Gtk.TextView()
         self.preview_text.set_editable(False)
@@ -134,129 +256,130 @@ class LyricsSelectionDialog(Adw.Dialog):
         button_box.set_spacing(12)
         button_box.set_halign(Gtk.Align.END)
         
-        cancel_button = Gtk.Button()
-        cancel_button.set_label("Cancel")
+        cancel_button = Gtk.Button(label="Cancel")
         cancel_button.connect('clicked', self._on_cancel_clicked)
         button_box.append(cancel_button)
         
-        self.download_button = Gtk.Button()
-        self.download_button.set_label("Download Selected")
-        self.download_button.add_css_class('suggested-action')
-        self.download_button.set_sensitive(False)
+        self.download_button = Gtk.Button(label="Download Selected", sensitive=False,
+                                          css_classes=['suggested-action'])
         self.download_button.connect('clicked', self._on_download_clicked)
         button_box.append(self.download_button)
         
         main_box.append(button_box)
         
-        # Select first result by default
-        if self.lyrics_results:
-            first_row = self.results_list.get_first_child()
-            if first_row:
-                self.results_list.select_row(first_row)
+        # The selection model already picked the first result by default;
+        # its preview is filled once the dialog is mapped, so the text view
+        # is not laid out while nothing is on screen yet
+        self.selection.connect('notify::selected-item', self._on_result_selected)
+        self.map_handler_id = self.connect('map', self._on_first_map)
         
         self.set_child(main_box)
     
-    def _create_result_row(self, result: LyricsResult) -> Gtk.ListBoxRow:
-        """Create a row for a lyrics result"""
-        row = Gtk.ListBoxRow()
-        row.lyrics_result = result
-        
-        row_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-        row_box.set_spacing(6)
-        row_box.set_margin_top(12)
-        row_box.set_margin_bottom(12)
-        row_box.set_margin_start(12)
-        row_box.set_margin_end(12)
-        
-        # Title and artist
-        title_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
-        title_box.set_spacing(8)
-        
-        title_label = Gtk.Label()
-        title_label.set_text(result.title)
-        title_label.set_halign(Gtk.Align.START)
-        title_label.set_hexpand(True)
-        title_label.add_css_class('heading')
-        title_box.append(title_label)
-        
-        # Accuracy indicator
-        accuracy_label = Gtk.Label()
-        accuracy_percent = int(result.accuracy_score * 100)
-        accuracy_label.set_text(f"{accuracy_percent}%")
-        accuracy_label.add_css_class('caption')
-        if accuracy_percent >= 80:
-            accuracy_label.add_css_class('success')
-        elif accuracy_percent >= 60:
-            accuracy_label.add_css_class('warning')
-        else:
-            accuracy_label.add_css_class('error')
-        title_box.append(accuracy_label)
-        
-        row_box.append(title_box)
-        
-        # Artist and album
-        artist_label = Gtk.Label()
-        artist_label.set_text(f"{result.artist} • {result.album}")
-        artist_label.set_halign(Gtk.Align.START)
-        artist_label.add_css_class('dim-label')
-        row_box.append(artist_label)
-        
-        # Duration and type info
-        info_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
-        info_box.set_spacing(12)
-        
-        duration_label = Gtk.Label()
-        duration_label.set_text(result.get_display_duration())
-        duration_label.add_css_class('caption')
-        info_box.append(duration_label)
-        
-        if result.has_synced_lyrics():
-            synced_label = Gtk.Label()
-            synced_label.set_text("• Synced")
-            synced_label.add_css_class('caption')
-            synced_label.add_css_class('success')
-            info_box.append(synced_label)
-        
-        source_label = Gtk.Label()
-        source_label.set_text(f"• {result.source.value}")
-        source_label.add_css_class('caption')
-        info_box.append(source_label)
-        
-        row_box.append(info_box)
-        
-        row.set_child(row_box)
-        return row
+    def _on_factory_setup(self, factory, list_item):
+        """Create a reusable result row"""
+        list_item.set_child(LyricsResultRow())
+    
+    def _on_factory_bind(self, factory, list_item):
+        """Show a lyrics result in a recycled row"""
+        result = list_item.get_item()
+        texts = self.display_texts.get(result)
+        if texts is None:
+            texts = self.display_texts[result] = _result_display_texts(result)
+        list_item.get_child().bind(texts)
     
-    def _on_result_selected(self, list_box, row):
+    def _on_first_map(self, dialog):
+        """Show the preview of the initially selected result"""
+        self.disconnect(self.map_handler_id)
+        self.map_handler_id = None
+        self._on_result_selected(self.selection, None)
+    
+    def _on_result_selected(self, selection, pspec):
         """Handle result selection"""
-        if row:
-            self.selected_result = row.lyrics_result
-            self.download_button.set_sensitive(True)
+        result = selection.get_selected_item()
+        self.selected_result = result
+        self.download_button.set_sensitive(result is not None)
+        
+        # Collapse quick selection changes (e.g. holding an arrow key)
+        # into one preview update for the result that ends up selected
+        if self.preview_source_id is None:
+            self.preview_source_id = GLib.idle_add(self._flush_preview)
+    
+    def _flush_preview(self):
+        """Show the preview of the currently selected result"""
+        self.preview_source_id = None
+        if self.selected_result:
             self._update_preview()
         else:
-            self.selected_result = None
-            self.download_button.set_sensitive(False)
             self._clear_preview()
+        return False
+    
+    def _on_closed(self, dialog):
+        """Drop a pending preview update when the dialog closes"""
+        if self.preview_source_id is not None:
+            GLib.source_remove(self.preview_source_id)
+            self.preview_source_id = None
     
     def _update_preview(self):
         """Update the lyrics preview"""
         if not self.selected_result:
             return
         
+        # Re-selecting the shown result (e.g. on focus changes) keeps the preview as is
+        if self.selected_result is self.previewed_result:
+            return
+        
+        # Switching back to a result reuses its already filled buffer
+        buffer = self.preview_buffers.get(self.selected_result)
+        if buffer is not None:
+            self.preview_buffers.move_to_end(self.selected_result)
+        else:
+            buffer = Gtk.TextBuffer()
+            
+            # Show synced lyrics if available, otherwise plain lyrics
+            lyrics_text = self.selected_result.synced_lyrics if self.selected_result.has_synced_lyrics() else self.selected_result.plain_lyrics
+            
+            if lyrics_text:
+                # Lay out only the head; the rest is appended while scrolling
+                lines = lyrics_text.split('\n')
+                buffer.set_text('\n'.join(lines[:PREVIEW_CHUNK_LINES]))
+                if len(lines) > PREVIEW_CHUNK_LINES:
+                    self.preview_pending_lines[buffer] = lines[PREVIEW_CHUNK_LINES:]
+            else:
+                buffer.set_text("No lyrics preview available")
+            
+            self.preview_buffers[self.selected_result] = buffer
+            if len(self.preview_buffers) > PREVIEW_CACHE_SIZE:
+                _, evicted = self.preview_buffers.popitem(last=False)
+                self.preview_pending_lines.pop(evicted, None)
+        
+        self.preview_text.set_buffer(buffer)
+        self.previewed_result = self.selected_result
+    
+    def _on_preview_scrolled(self, adjustment):
+        """Append more lyrics lines when the preview nears its end"""
         buffer = self.preview_text.get_buffer()
+        pending_lines = self.preview_pending_lines.get(buffer)
+        if not pending_lines:
+            return
         
-        # Show synced lyrics if available, otherwise plain lyrics
-        lyrics_text = self.selected_result.synced_lyrics if self.selected_result.has_synced_lyrics() else self.selected_result.plain_lyrics
+        # Load the next chunk once less than a page is left below the view
+        remaining = adjustment.get_upper() - adjustment.get_value() - adjustment.get_page_size()
+        if remaining > adjustment.get_page_size():
+            return
         
-        if lyrics_text:
-            buffer.set_text(lyrics_text)
-        else:
-            buffer.set_text("No lyrics preview available")
+        chunk = pending_lines[:PREVIEW_CHUNK_LINES]
+        del pending_lines[:PREVIEW_CHUNK_LINES]
+        buffer.insert(buffer.get_end_iter(), '\n' + '\n'.join(chunk))
+        if not pending_lines:
+            del self.preview_pending_lines[buffer]
     
     def _clear_preview(self):
         """Clear the lyrics preview"""
-        buffer = self.preview_text.get_buffer()
+        # Use a fresh buffer so no cached preview gets overwritten
+        buffer = Gtk.TextBuffer()
         buffer.set_text("Select a result to preview lyrics")
+        self.preview_text.set_buffer(buffer)
+        self.previewed_result = None
     
     def _on_cancel_clicked(self, button):
         """Handle cancel button click"""
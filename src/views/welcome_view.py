@@ -20,6 +20,8 @@
 from gi.repository import Adw, Gtk, GObject
 from ..services.logger_service import get_logger
 
+ICON_SIZE = 128  # Size of the welcome icon in pixels
+
 class WelcomeView(Gtk.Box):
     """Welcome screen with directory chooser"""
     
@@ -32,6 +34,7 @@ class WelcomeView(Gtk.Box):
     def __init__(self):
         super().__init__(orientation=Gtk.Orientation.VERTICAL)
         self.logger = get_logger('welcome_view')
+        self.file_dialog = None  # Directory chooser, created on first use
         self.set_vexpand(True)
         self.set_hexpand(True)
         self.set_valign(Gtk.Align.CENTER)
@@ -45,45 +48,46 @@ class WelcomeView(Gtk.Box):
         content_box.set_valign(Gtk.Align.CENTER)
         
         # Icon
-        icon = Gtk.Image()
-        icon.set_from_icon_name('folder-music-symbolic')
-        icon.set_pixel_size(128)
+        icon = Gtk.Image.new_from_icon_name('folder-music-symbolic')
+        icon.set_pixel_size(ICON_SIZE)
         icon.add_css_class('dim-label')
         icon.set_halign(Gtk.Align.CENTER)
         content_box.append(icon)
         
         # Title
-        title_label = Gtk.Label()
-        title_label.set_text('Welcome to Composer')
-        title_label.set_halign(Gtk.Align.CENTER)
-        title_label.set_wrap(True)
-        title_label.set_wrap_mode(Gtk.WrapMode.WORD_CHAR)
-        title_label.set_justify(Gtk.Justification.CENTER)
-        title_label.set_margin_start(12)
-        title_label.set_margin_end(12)
-        title_label.add_css_class('title-1')
+        title_label = Gtk.Label(
+            label='Welcome to Composer',
+            halign=Gtk.Align.CENTER,
+            wrap=True,
+            wrap_mode=Gtk.WrapMode.WORD_CHAR,
+            justify=Gtk.Justification.CENTER,
+            margin_start=12,
+            margin_end=12,
+            css_classes=['title-1'],
+        )
         content_box.append(title_label)
         
         # Description
-        desc_label = Gtk.Label()
-        desc_label.set_text('Choose your music directory to get started and explore your music collection')
-        desc_label.set_halign(Gtk.Align.CENTER)
-        desc_label.set_wrap(True)
-        desc_label.set_wrap_mode(Gtk.WrapMode.WORD_CHAR)
-        desc_label.set_justify(Gtk.Justification.CENTER)
-        desc_label.set_max_width_chars(50)
-        desc_label.set_margin_start(12)
-        desc_label.set_margin_end(12)
-        desc_label.add_css_class('body')
-        desc_label.add_css_class('dim-label')
+        desc_label = Gtk.Label(
+            label='Choose your music directory to get started and explore your music collection',
+            halign=Gtk.Align.CENTER,
+            wrap=True,
+            wrap_mode=Gtk.WrapMode.WORD_CHAR,
+            justify=Gtk.Justification.CENTER,
+            max_width_chars=50,
+            margin_start=12,
+            margin_end=12,
+            css_classes=['body', 'dim-label'],
+        )
         content_box.append(desc_label)
         
         # Create choose directory button
-        self.choose_button = Gtk.Button(label='Choose Music Directory')
-        self.choose_button.set_halign(Gtk.Align.CENTER)
-        self.choose_button.set_margin_top(16)
-        self.choose_button.add_css_class('pill')
-        self.choose_button.add_css_class('suggested-action')
+        self.choose_button = Gtk.Button(
+            label='Choose Music Directory',
+            halign=Gtk.Align.CENTER,
+            margin_top=16,
+            css_classes=['pill', 'suggested-action'],
+        )
         self.choose_button.connect('clicked', self._on_choose_clicked)
         content_box.append(self.choose_button)
         
@@ -101,19 +105,21 @@ class WelcomeView(Gtk.Box):
     
     def _on_choose_clicked(self, button):
         """Handle directory chooser button click"""
-        dialog = Gtk.FileDialog()
-        dialog.set_title("Choose Music Directory")
-        dialog.set_modal(True)
-        
-        def on_response(dialog, result):
-            try:
-                folder = dialog.select_folder_finish(result)
-                if folder:
-                    folder_path = folder.get_path()
-                    self.emit('directory-selected', folder_path)
-            except Exception as e:
-                self.logger.error(f"Error selecting folder: {e}")
+        if self.file_dialog is None:
+            self.file_dialog = Gtk.FileDialog()
+            self.file_dialog.set_title("Choose Music Directory")
+            self.file_dialog.set_modal(True)
         
         # Get the toplevel window
         toplevel = self.get_root()
-        dialog.select_folder(toplevel, None, on_response)
+        self.file_dialog.select_folder(toplevel, None, self._on_folder_selected)
+    
+    def _on_folder_selected(self, dialog, result):
+        """Handle the directory chooser response"""
+        try:
+            folder = dialog.select_folder_finish(result)
+            if folder:
+                folder_path = folder.get_path()
+                self.emit('directory-selected', folder_path)
+        except Exception as e:
+            self.logger.error(f"Error selecting folder: {e}")
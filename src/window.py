@@ -17,14 +17,15 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from gi.repository import Adw, Gtk, Gio
+from collections import deque
+from functools import partial
+from gi.repository import Adw, Gtk, Gio, GLib
 from .views.welcome_view import WelcomeView
 from .views.library_view import LibraryView
 from .views.preferences_dialog import PreferencesDialog
 from .services.music_scanner import MusicScanner
 from .services.lyrics_service import LyricsService
 from .services.settings_service import SettingsService
-from .services.file_service import FileService
 from .services.logger_service import get_logger
 
 @Gtk.Template(resource_path='/id/ngoding/Composer/window.ui')
@@ -50,9 +51,22 @@ class ComposerWindow(Adw.ApplicationWindow):
         self.lyrics_service = LyricsService()
         self.settings_service = SettingsService()
         
+        # Latest auto-download progress, pushed to the library view on one idle callback
+        self.pending_auto_download_state = None  # (downloading, completed, total)
+        self.ui_source_id = None
+        
+        # Auto-download settings, read per scan instead of per found file
+        self.auto_download_enabled = False
+        self.overwrite_existing_lyrics = False
+        
         # Track auto-download progress
-        self.auto_download_queue = []
+        self.pending_lyrics_checks = []  # Scanned files queued once the library knows their lyrics status
+        self.awaiting_lyrics_status = False  # Scan completed, waiting for the library's lyrics check
+        self.auto_download_queue = deque()
+        self.auto_download_cancellable = Gio.Cancellable()  # Replaced whenever auto-download is cancelled
         self.auto_download_in_progress = False
+        self.auto_download_in_flight = 0  # Searches and downloads currently running
+        self.auto_download_max_in_flight = 1  # Read from settings when auto-download starts
         self.auto_download_completed = 0
         self.auto_download_total = 0
         
@@ -100,14 +114,21 @@ class ComposerWindow(Adw.ApplicationWindow):
         self.library_view.connect('directory-selected', self._on_directory_selected)
         self.library_view.connect('lyrics-downloaded', self._on_lyrics_downloaded)
         self.library_view.connect('lyrics-error', self._on_lyrics_error)
+        self.library_view.connect('lyrics-status-checked', self._on_lyrics_status_checked)
         
-        # Music scanner signals
+        # Music scanner signals. The scanner thread delivers them through idle
+        # callbacks: found-file batches and completion at the default idle
+        # priority, so completion always follows the last batch, and progress
+        # at low priority, so redraws and new rows are never held up by it
         self.music_scanner.connect('scan-started', self._on_scan_started)
-        self.music_scanner.connect('file-found', self._on_file_found)
+        self.music_scanner.connect('files-found-batch', self._on_files_found_batch)
         self.music_scanner.connect('scan-progress', self._on_scan_progress)
         self.music_scanner.connect('scan-completed', self._on_scan_completed)
         self.music_scanner.connect('scan-error', self._on_scan_error)
         
+        # Keep the auto-download settings current if they change mid-scan
+        self.settings_service.connect('settings-changed', self._on_settings_changed)
+        
         # Lyrics service signals for auto-download
         self.lyrics_service.connect('download-completed', self._on_auto_download_completed)
         self.lyrics_service.connect('download-error', self._on_auto_download_error)
@@ -115,11 +136,12 @@ class ComposerWindow(Adw.ApplicationWindow):
     def _on_directory_selected(self, source_view, directory_path):
         """Handle directory selection from welcome view or library view"""
         # Clear previous results
+        self._cancel_ui_updates()
         self.library_view.clear_music_list()
         
         # Reset auto-download state
-        self.auto_download_queue.clear()
-        self.auto_download_in_progress = False
+        self._read_auto_download_settings()
+        self._cancel_auto_download()
         self.auto_download_completed = 0
         self.auto_download_total = 0
         
@@ -132,6 +154,16 @@ class ComposerWindow(Adw.ApplicationWindow):
         # Start scanning in background
         self.music_scanner.scan_directory_async(directory_path)
     
+    def _read_auto_download_settings(self):
+        """Read the settings that decide which scanned files get auto-downloaded"""
+        self.auto_download_enabled = self.settings_service.get_auto_download_lyrics()
+        self.overwrite_existing_lyrics = self.settings_service.get_overwrite_existing_lyrics()
+    
+    def _on_settings_changed(self, settings_service, key):
+        """Refresh the cached auto-download settings when one of them changes"""
+        if key in ('auto-download-lyrics', 'overwrite-existing-lyrics'):
+            self._read_auto_download_settings()
+    
     def _on_back_button_clicked(self, button):
         """Handle header bar back button click"""
         # Switch back to welcome view
@@ -140,40 +172,73 @@ class ComposerWindow(Adw.ApplicationWindow):
         # Hide back button
         self.back_button.set_visible(False)
         
-        # Cancel any ongoing scan
+        # Cancel any ongoing scan and the lyrics downloads it started
         self.music_scanner.cancel_scan()
+        self._cancel_auto_download()
+        self._cancel_ui_updates()
+        self.library_view.set_auto_download_state(False)
+    
+    def _cancel_auto_download(self):
+        """Stop auto-downloading and drop results of searches still running"""
+        self.auto_download_cancellable.cancel()
+        self.auto_download_cancellable = Gio.Cancellable()
+        self.awaiting_lyrics_status = False
+        self.pending_lyrics_checks.clear()
+        self.auto_download_queue.clear()
+        self.auto_download_in_progress = False
+        self.auto_download_in_flight = 0
     
     def _on_scan_started(self, scanner):
         """Handle scan started"""
         self.library_view.set_scanning_state(True)
     
-    def _on_file_found(self, scanner, music_file):
-        """Handle when a music file is found"""
-        self.library_view.add_music_file(music_file)
+    def _on_files_found_batch(self, scanner, music_files):
+        """Handle a batch of music files found by the scanner"""
+        self.library_view.add_music_files_batch(music_files)
         
         # Check if auto-download is enabled
-        if self.settings_service.get_auto_download_lyrics():
-            # Check if we should download lyrics for this file
-            should_download = True
-            
-            # If overwrite is disabled, skip files that already have lyrics
-            if not self.settings_service.get_overwrite_existing_lyrics():
-                if FileService.lyrics_exist(music_file['path']):
-                    should_download = False
-            
-            if should_download:
-                self.auto_download_queue.append(music_file)
+        if self.auto_download_enabled:
+            # If overwrite is disabled, files that already have lyrics are
+            # skipped; the library view checks every file anyway, so they
+            # are queued once it has recorded the status on each item
+            if self.overwrite_existing_lyrics:
+                self.auto_download_queue.extend(music_files)
+            else:
+                self.pending_lyrics_checks.extend(music_files)
     
     def _on_scan_progress(self, scanner, processed, total):
         """Handle scan progress update"""
+        # Low-priority progress may still arrive after the scan completed
+        if not self.library_view.scanning:
+            return
         self.library_view.update_scan_progress(processed, total)
     
     def _on_scan_completed(self, scanner, music_files):
         """Handle scan completion"""
         self.library_view.set_scan_completed(len(music_files))
         
-        # Start auto-download if enabled and there are files to download
-        if self.settings_service.get_auto_download_lyrics() and self.auto_download_queue:
+        if not self.auto_download_enabled:
+            return
+        
+        if self.pending_lyrics_checks:
+            # Queued once the library view reports the lyrics status
+            self.awaiting_lyrics_status = True
+        else:
+            self._begin_auto_download()
+    
+    def _on_lyrics_status_checked(self, library_view):
+        """Queue the scanned files without lyrics for auto-download"""
+        if not self.awaiting_lyrics_status:
+            return
+        self.awaiting_lyrics_status = False
+        
+        music_files, self.pending_lyrics_checks = self.pending_lyrics_checks, []
+        self.auto_download_queue.extend(music_file for music_file in music_files if not music_file.has_lyrics)
+        self._begin_auto_download()
+    
+    def _begin_auto_download(self):
+        """Start auto-download if there are files to download"""
+        if self.auto_download_queue:
             self.auto_download_total = len(self.auto_download_queue)
             self.auto_download_completed = 0
             self._start_auto_download()
@@ -184,6 +249,27 @@ class ComposerWindow(Adw.ApplicationWindow):
         self.library_view.set_scanning_state(False)
         self.library_view.subtitle_label.set_text(f"Error scanning directory: {error_message}")
     
+    def _queue_auto_download_state(self, downloading):
+        """Record the latest auto-download progress and schedule one UI update"""
+        self.pending_auto_download_state = (downloading, self.auto_download_completed, self.auto_download_total)
+        if self.ui_source_id is None:
+            self.ui_source_id = GLib.idle_add(self._flush_auto_download_state)
+    
+    def _flush_auto_download_state(self):
+        """Push the latest recorded auto-download progress to the library view"""
+        self.ui_source_id = None
+        state, self.pending_auto_download_state = self.pending_auto_download_state, None
+        if state is not None:
+            self.library_view.set_auto_download_state(*state)
+        return False
+    
+    def _cancel_ui_updates(self):
+        """Drop progress updates that were not shown yet"""
+        if self.ui_source_id is not None:
+            GLib.source_remove(self.ui_source_id)
+            self.ui_source_id = None
+        self.pending_auto_download_state = None
+    
     def _on_lyrics_downloaded(self, library_view, music_file_path, lrc_path):
         """Handle successful lyrics download"""
         # Logging is handled by auto-download handler to avoid duplicates
@@ -200,28 +286,39 @@ class ComposerWindow(Adw.ApplicationWindow):
             return
         
         self.auto_download_in_progress = True
-        self.library_view.set_auto_download_state(True, self.auto_download_completed, self.auto_download_total)
+        self.auto_download_max_in_flight = max(1, self.settings_service.get_max_concurrent_downloads())
+        self._queue_auto_download_state(True)
         self._process_next_auto_download()
     
     def _process_next_auto_download(self):
-        """Process the next file in the auto-download queue"""
-        if not self.auto_download_queue:
+        """Start queued auto-downloads until the concurrency limit is reached"""
+        # Network round trips dominate, so several files are searched and
+        # downloaded at once, bounded to stay polite to the lyrics provider
+        while self.auto_download_queue and self.auto_download_in_flight < self.auto_download_max_in_flight:
+            music_file = self.auto_download_queue.popleft()
+            self.auto_download_in_flight += 1
+            
+            # Start lyrics search for this file
+            self.lyrics_service.search_lyrics_async(
+                title=music_file.title,
+                artist=music_file.artist,
+                album=music_file.album,
+                duration=int(music_file.duration_seconds),
+                callback=partial(self._handle_auto_download_search_results, music_file),
+                cancellable=self.auto_download_cancellable
+            )
+        
+        if not self.auto_download_queue and self.auto_download_in_flight == 0 and self.auto_download_in_progress:
             # All downloads completed
             self.auto_download_in_progress = False
-            self.library_view.set_auto_download_state(False, self.auto_download_completed, self.auto_download_total)
-            return
-        
-        # Get next file to download
-        music_file = self.auto_download_queue.pop(0)
-        
-        # Start lyrics search for this file
-        self.lyrics_service.search_lyrics_async(
-            title=music_file['title'],
-            artist=music_file['artist'],
-            album=music_file['album'],
-            duration=int(music_file.get('duration_seconds', 0)),
-            callback=lambda results: self._handle_auto_download_search_results(music_file, results)
-        )
+            self._queue_auto_download_state(False)
+    
+    def _finish_auto_download(self):
+        """Count one finished auto-download and start the next one"""
+        self.auto_download_in_flight = max(0, self.auto_download_in_flight - 1)
+        self.auto_download_completed += 1
+        self._queue_auto_download_state(True)
+        self._process_next_auto_download()
     
     def _handle_auto_download_search_results(self, music_file, results):
         """Handle search results for auto-download"""
@@ -229,31 +326,25 @@ class ComposerWindow(Adw.ApplicationWindow):
             # Use the first (best) result for auto-download
             best_result = results[0]
             self.lyrics_service.download_lyrics_async(
-                music_file_path=music_file['path'],
-                lyrics_result=best_result
+                music_file_path=music_file.path,
+                lyrics_result=best_result,
+                cancellable=self.auto_download_cancellable
             )
         else:
             # No lyrics found, move to next file
-            self.auto_download_completed += 1
-            self.library_view.set_auto_download_state(True, self.auto_download_completed, self.auto_download_total)
-            self._process_next_auto_download()
+            self._finish_auto_download()
     
     def _on_auto_download_completed(self, service, music_file_path, lrc_path):
         """Handle completion of an auto-download"""
-        self.auto_download_completed += 1
-        self.library_view.set_auto_download_state(True, self.auto_download_completed, self.auto_download_total)
-        
         # Update the specific row in the library view
         self.library_view.refresh_file_row(music_file_path)
         
         # Process next download
-        self._process_next_auto_download()
+        self._finish_auto_download()
     
     def _on_auto_download_error(self, service, music_file_path, error_message):
         """Handle error in auto-download"""
         self.logger.error(f"Auto-download error for {music_file_path}: {error_message}")
-        self.auto_download_completed += 1
-        self.library_view.set_auto_download_state(True, self.auto_download_completed, self.auto_download_total)
         
         # Process next download
-        self._process_next_auto_download()
+        self._finish_auto_download()